@@ -80,6 +80,7 @@ Optional:
     --id PROFILE_ID     Eigene ID für das Profil (Standard: Dateiname)
     --output, -o FILE   Speichert JSON-Profil in Datei
     --report, -r FILE   Speichert Text-Report in Datei
+    --output-root DIR   Basisordner für die Timestamp-Ordner (Standard: ./auswertung)
     --quiet, -q         Keine Ausgabe auf Bildschirm
 
 Hilfe:
@@ -127,7 +128,7 @@ TECHNISCHE DETAILS
 
 - Erwartet Python 3.7+
 - Keine externen Dependencies erforderlich
-- Verwendet nur Python-Standardbibliothek
+- Verwendet nur Python-Standardbibliothek (optional: orjson für schnellere JSON-Ausgabe)
 - Alle Berechnungen sind deterministisch und transparent
 - Reverse-Scoring für 27 Items automatisch
 
@@ -137,14 +138,27 @@ Instrument: 88 Items, 6 Hauptdimensionen, 2 Zusatzindizes
 
 from __future__ import annotations
 
-import argparse
 import csv
+import functools
+import io
+from array import array
 import json
+import operator
 import sys
-from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Any, NamedTuple, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import argparse
+
+# argparse und datetime werden nur von der CLI benötigt und erst dort importiert,
+# damit der Import als Bibliothek (z.B. Batch-Auswertung) schlank bleibt.
+
+try:
+    import orjson  # Optional: C-basierte JSON-Serialisierung
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 VERSION = "0.2.1"
 
@@ -169,8 +183,8 @@ DIMENSION_LABELS: Dict[str, str] = {
 }
 
 
-@dataclass(frozen=True)
-class ItemDefinition:
+class ItemDefinition(NamedTuple):
+    """Unveränderliche Item-Definition (tuple-basiert, kein __dict__ pro Instanz)."""
     code: str
     dimension_code: str
     include_in_main_scale: bool
@@ -179,13 +193,7 @@ class ItemDefinition:
 
 
 def _i(code: str, dim: str, facet: str = "", include: bool = True, reverse: bool = False) -> ItemDefinition:
-    return ItemDefinition(
-        code=code,
-        dimension_code=dim,
-        facet=facet,
-        include_in_main_scale=include,
-        reverse_scored=reverse
-    )
+    return ItemDefinition(code, dim, include, reverse, facet)
 
 
 # Item-Definitionen für Version 0.2.x (88 Items, konsistent mit Fragebogen)
@@ -294,6 +302,9 @@ ITEM_DEFINITIONS: Dict[str, ItemDefinition] = {
 
 LIKERT_MIN = 1
 LIKERT_MAX = 5
+_LIKERT_SUM = LIKERT_MIN + LIKERT_MAX  # Reverse-Coding: _LIKERT_SUM - Wert
+# Gültige Likert-Werte als Strings → int (spart int() für den Normalfall beim CSV-Einlesen)
+_FAST_INT: Dict[str, int] = {str(v): v for v in range(LIKERT_MIN, LIKERT_MAX + 1)}
 
 # Instrument-Konsistenzprüfung beim Import
 MAIN_ITEMS_DEFINED = [i for i in ITEM_DEFINITIONS.values() if i.include_in_main_scale]
@@ -304,6 +315,95 @@ assert len(MAIN_ITEMS_DEFINED) == 80, "Hauptskalen müssen genau 80 Items haben"
 assert len(INDEX_ITEMS_DEFINED) == 8, "Zusatzindizes müssen genau 8 Items haben"
 assert sum(1 for i in MAIN_ITEMS_DEFINED if i.reverse_scored) == 27, "Hauptskalen müssen genau 27 Reverse-Items haben"
 
+# Hauptskalen-Items je Dimension und deren Anzahl Reverse-Items (einmalig gruppiert)
+BY_DIMENSION: Dict[str, List[ItemDefinition]] = {
+    code: [i for i in MAIN_ITEMS_DEFINED if i.dimension_code == code]
+    for code in DIMENSION_LABELS
+}
+REVERSE_COUNT_BY_DIM: Dict[str, int] = {
+    code: sum(1 for i in items if i.reverse_scored)
+    for code, items in BY_DIMENSION.items()
+}
+
+# Invariante Instrument-Kennzahlen für die Profil-Metadaten
+_INSTRUMENT_SIZE = len(ITEM_DEFINITIONS)
+_NUM_MAIN_ITEMS = len(MAIN_ITEMS_DEFINED)
+_NUM_INDEX_ITEMS = len(INDEX_ITEMS_DEFINED)
+_NUM_REVERSED_TOTAL = sum(1 for i in MAIN_ITEMS_DEFINED if i.reverse_scored)
+
+# Vorberechnete Index-Tabellen (einmalig beim Import, feste Item-Reihenfolge)
+_DIM_CODES = tuple(DIMENSION_LABELS)
+_DIM_IDX: Dict[str, int] = {code: idx for idx, code in enumerate(_DIM_CODES)}
+_ITEM_ORDER = tuple(ITEM_DEFINITIONS)
+_ITEM_CODES: FrozenSet[str] = frozenset(ITEM_DEFINITIONS)
+_DIM_VEC = tuple(_DIM_IDX[ITEM_DEFINITIONS[c].dimension_code] for c in _ITEM_ORDER)
+_REV_VEC = tuple(ITEM_DEFINITIONS[c].reverse_scored for c in _ITEM_ORDER)
+_MAIN_MASK = tuple(ITEM_DEFINITIONS[c].include_in_main_scale for c in _ITEM_ORDER)
+
+# Positionen der Hauptskalen-Items je Dimension (Index in _ITEM_ORDER)
+_DIM_POSITIONS = tuple(
+    tuple(pos for pos, (dim_idx, main) in enumerate(zip(_DIM_VEC, _MAIN_MASK))
+          if main and dim_idx == target)
+    for target in range(len(_DIM_CODES))
+)
+
+# Flache Tabelle der Hauptskalen-Items (code, dim_idx, reverse) ohne Attributzugriffe
+# auf ItemDefinition; Grundlage für den generierten Dimension-Scorer
+_MAIN_TABLE = tuple(
+    (code, dim_idx, rev)
+    for code, dim_idx, rev, main in zip(_ITEM_ORDER, _DIM_VEC, _REV_VEC, _MAIN_MASK)
+    if main
+)
+
+# Invarianten je Dimension: Anzahl Items und davon reverse
+_DIM_COUNTS = tuple(len(positions) for positions in _DIM_POSITIONS)
+_DIM_NUM_REVERSED = tuple(sum(_REV_VEC[pos] for pos in positions) for positions in _DIM_POSITIONS)
+
+# Sortierte Item-Codes je Dimension (unveränderliche Tupel, werden im Profil geteilt)
+_DIM_ITEMS_SORTED: Dict[str, Tuple[str, ...]] = {
+    dim_code: tuple(sorted(_ITEM_ORDER[pos] for pos in positions))
+    for dim_code, positions in zip(_DIM_CODES, _DIM_POSITIONS)
+}
+
+
+def _build_dimension_scorer():
+    """
+    Erzeugt beim Import eine auf die feste Item-Struktur spezialisierte Summenfunktion.
+
+    Je Dimension entstehen zwei flache Ausdrücke (reverse-codierte Summe und Rohsumme),
+    z.B. r['A1'] + (6 - r['A2']) + ... – ohne Schleife und ohne Zwischenlisten.
+    Der generierte Quelltext bleibt zur Nachvollziehbarkeit lesbar erhalten.
+    """
+    final_lines = []
+    raw_lines = []
+    for dim_idx, dim_code in enumerate(_DIM_CODES):
+        rows = [(code, rev) for code, d, rev in _MAIN_TABLE if d == dim_idx]
+        final_expr = " + ".join(
+            f"({_LIKERT_SUM} - r[{code!r}])" if rev else f"r[{code!r}]" for code, rev in rows
+        )
+        raw_expr = " + ".join(f"r[{code!r}]" for code, _ in rows)
+        final_lines.append(f"        {final_expr or '0'},  # {dim_code}")
+        raw_lines.append(f"        {raw_expr or '0'},  # {dim_code}")
+
+    source = "\n".join([
+        "def _score_dimensions(r):",
+        "    sums = (",
+        *final_lines,
+        "    )",
+        "    raw_sums = (",
+        *raw_lines,
+        "    )",
+        "    return sums, raw_sums",
+        "",
+    ])
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<auswertung._score_dimensions>", "exec"), namespace)
+    return namespace["_score_dimensions"], source
+
+
+# Spezialisierte Scoring-Funktion; Quelltext in _DIMENSION_SCORER_SOURCE einsehbar
+_score_dimensions, _DIMENSION_SCORER_SOURCE = _build_dimension_scorer()
+
 
 # ---------------------------------------------------------------------------
 # Kernlogik
@@ -313,12 +413,15 @@ def reverse_likert(value: int) -> int:
     """
     Invertiert einen Likert-Wert (1..5) zu seinem Gegenwert.
     1 -> 5, 2 -> 4, 3 -> 3, 4 -> 2, 5 -> 1
+
+    Öffentliche API mit Typ- und Range-Prüfung; die Scoring-Funktionen rechnen
+    nach validate_ratings direkt mit _LIKERT_SUM - Wert.
     """
     if not isinstance(value, int):
         raise TypeError(f"Likert-Wert muss int sein, erhalten: {type(value).__name__}")
     if not (LIKERT_MIN <= value <= LIKERT_MAX):
         raise ValueError(f"Likert-Wert muss zwischen {LIKERT_MIN} und {LIKERT_MAX} liegen, erhalten: {value}")
-    return LIKERT_MIN + LIKERT_MAX - value
+    return _LIKERT_SUM - value
 
 
 def classify_score(score: float) -> str:
@@ -346,9 +449,13 @@ def check_response_quality(ratings: Dict[str, int]) -> Dict[str, Any]:
     # Straight-Lining Detection (nur 1-2 verschiedene Antworten)
     unique_values = len(set(values))
     
-    # Varianz berechnen
-    mean_val = sum(values) / len(values)
-    variance = sum((v - mean_val) ** 2 for v in values) / len(values)
+    # Varianz in einem Rechenschritt aus Summe und Quadratsumme (exakt für int-Ratings):
+    # Var = (n·Σv² − (Σv)²) / n²
+    n = len(values)
+    total = sum(values)
+    total_sq = sum(map(operator.mul, values, values))
+    mean_val = total / n
+    variance = (n * total_sq - total * total) / (n * n)
     
     # Quality-Flag setzen
     quality_warnings = []
@@ -373,19 +480,52 @@ def validate_ratings(ratings: Dict[str, int]) -> None:
     Validiert ein Ratings-Dict auf Vollständigkeit und korrekte Werte.
     Wirft ValueError oder TypeError bei Problemen.
     """
-    missing = set(ITEM_DEFINITIONS) - set(ratings)
-    extra = set(ratings) - set(ITEM_DEFINITIONS)
+    # dict_keys unterstützt Mengenoperationen direkt gegen das vorberechnete frozenset
+    keys = ratings.keys()
+    missing = _ITEM_CODES - keys
+    extra = keys - _ITEM_CODES
     
     if missing:
         raise ValueError(f"Fehlende Items: {', '.join(sorted(missing))}")
     if extra:
         raise ValueError(f"Unbekannte Items: {', '.join(sorted(extra))}")
     
+    lo, hi = LIKERT_MIN, LIKERT_MAX
     for code, value in ratings.items():
         if not isinstance(value, int):
             raise TypeError(f"Rating für {code} ist kein int: {value!r}")
-        if not (LIKERT_MIN <= value <= LIKERT_MAX):
-            raise ValueError(f"Rating für {code} außerhalb des erlaubten Bereichs {LIKERT_MIN}-{LIKERT_MAX}: {value}")
+        if not (lo <= value <= hi):
+            raise ValueError(f"Rating für {code} außerhalb des erlaubten Bereichs {lo}-{hi}: {value}")
+
+
+def ratings_to_array(ratings: Dict[str, int]) -> array:
+    """
+    Packt ein validiertes Ratings-Dict in ein kompaktes array('b') mit 88 Einträgen
+    (1 Byte je Item, Reihenfolge wie ITEM_DEFINITIONS). Sinnvoll zum Speichern
+    vieler Antwortsätze; die Scoring-Funktionen arbeiten weiterhin mit Dicts.
+    """
+    validate_ratings(ratings)
+    return array("b", map(ratings.__getitem__, _ITEM_ORDER))
+
+
+def ratings_from_array(values: Sequence[int]) -> Dict[str, int]:
+    """
+    Erzeugt aus einem array('b') (oder einer anderen Sequenz von 88 ganzzahligen
+    Werten in ITEM_DEFINITIONS-Reihenfolge, z.B. einer numpy-int8-Zeile) wieder
+    ein validiertes Ratings-Dict mit Python-ints.
+    Wirft ValueError oder TypeError wie validate_ratings.
+    """
+    if len(values) != len(_ITEM_ORDER):
+        raise ValueError(
+            f"Erwartet {len(_ITEM_ORDER)} Werte in Item-Reihenfolge, erhalten: {len(values)}"
+        )
+    # operator.index: numpy-Ganzzahlen → int, Floats werden abgelehnt statt abgeschnitten
+    try:
+        ratings = dict(zip(_ITEM_ORDER, map(operator.index, values)))
+    except TypeError as exc:
+        raise TypeError(f"Ratings müssen ganzzahlig sein: {exc}") from exc
+    validate_ratings(ratings)
+    return ratings
 
 
 def load_ratings_from_csv(path: Path) -> Dict[str, int]:
@@ -397,50 +537,81 @@ def load_ratings_from_csv(path: Path) -> Dict[str, int]:
         ...
 
     Zusätzliche Spalten werden ignoriert. Es wird genau eine Person pro Datei erwartet.
+
+    Dateien ohne Anführungszeichen (z.B. das Minimalformat item_code,rating) werden
+    direkt an Kommas getrennt; sobald Quoting vorkommt, übernimmt das csv-Modul.
     """
     ratings: Dict[str, int] = {}
     
     with path.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        
-        # Flexible Spaltenprüfung: Mindestens item_code und rating müssen vorhanden sein
-        required_fields = {"item_code", "rating"}
-        if not reader.fieldnames or not required_fields.issubset(reader.fieldnames):
+        text = f.read()
+
+    if '"' in text:
+        # Quoting vorhanden (z.B. item_text mit Kommas) → vollständiger CSV-Parser
+        reader = csv.reader(io.StringIO(text, newline=""))
+    else:
+        # Ohne Quoting ist jede Zeile ein einfacher Komma-Split
+        reader = (line.split(",") for line in text.splitlines())
+
+    header = next(reader, None)
+
+    # Flexible Spaltenprüfung: Mindestens item_code und rating müssen vorhanden sein
+    required_fields = {"item_code", "rating"}
+    if not header or not required_fields.issubset(header):
+        raise ValueError(
+            f"CSV muss mindestens die Spalten {required_fields} besitzen, "
+            f"gefunden: {header}"
+        )
+
+    # Spaltenpositionen einmalig aus dem Header bestimmen (kein Dict pro Zeile)
+    code_col = header.index("item_code")
+    rating_col = header.index("rating")
+    min_len = max(code_col, rating_col) + 1
+    item_defs = ITEM_DEFINITIONS
+    fast_int = _FAST_INT.get
+    lo, hi = LIKERT_MIN, LIKERT_MAX
+
+    for row_num, row in enumerate(reader, start=2):  # Start bei 2 (nach Header)
+        if len(row) < min_len:
+            if not "".join(row).strip():  # Leere Zeile (auch nur Leerzeichen) überspringen
+                continue
             raise ValueError(
-                f"CSV muss mindestens die Spalten {required_fields} besitzen, "
-                f"gefunden: {reader.fieldnames}"
+                f"Zeile {row_num} von {path} hat zu wenige Spalten "
+                f"(erwartet mindestens {min_len}, gefunden: {len(row)})"
             )
-        
-        for row_num, row in enumerate(reader, start=2):  # Start bei 2 (nach Header)
-            code = row["item_code"].strip()
-            
-            if not code:  # Leere Zeile überspringen
-                continue
-            
-            if code in ratings:
-                raise ValueError(f"Doppelter Eintrag für Item {code} in Zeile {row_num} von {path}")
-            
-            if code not in ITEM_DEFINITIONS:
-                raise ValueError(f"Unbekannter item_code '{code}' in Zeile {row_num} von {path}")
-            
-            raw_value_str = row["rating"].strip()
+
+        code = row[code_col].strip()
+
+        if not code:  # Leere Zeile überspringen
+            continue
+
+        if code in ratings:
+            raise ValueError(f"Doppelter Eintrag für Item {code} in Zeile {row_num} von {path}")
+
+        if code not in item_defs:
+            raise ValueError(f"Unbekannter item_code '{code}' in Zeile {row_num} von {path}")
+
+        raw_value_str = row[rating_col].strip()
+        raw_value = fast_int(raw_value_str)
+        if raw_value is None:
+            # Kein direkter Treffer "1".."5": allgemein parsen und Bereich prüfen
             try:
                 raw_value = int(raw_value_str)
             except ValueError as exc:
                 raise ValueError(
                     f"Ungültiger Wert für rating bei Item {code} in Zeile {row_num}: '{raw_value_str}'"
                 ) from exc
-            
-            if not (LIKERT_MIN <= raw_value <= LIKERT_MAX):
+
+            if not (lo <= raw_value <= hi):
                 raise ValueError(
                     f"rating bei Item {code} in Zeile {row_num} muss zwischen "
-                    f"{LIKERT_MIN} und {LIKERT_MAX} liegen, erhalten: {raw_value}"
+                    f"{lo} und {hi} liegen, erhalten: {raw_value}"
                 )
-            
-            ratings[code] = raw_value
+
+        ratings[code] = raw_value
 
     # Prüfen, ob alle Items vorhanden sind
-    missing = sorted(set(ITEM_DEFINITIONS.keys()) - set(ratings.keys()))
+    missing = sorted(_ITEM_CODES - ratings.keys())
     if missing:
         raise ValueError(
             f"Die folgenden Items fehlen in der Datei {path}: {', '.join(missing)}"
@@ -455,46 +626,35 @@ def load_ratings_from_csv(path: Path) -> Dict[str, int]:
 def compute_dimension_scores(ratings: Dict[str, int]) -> Dict[str, Dict[str, Any]]:
     """
     Berechnet für jede der 6 Hauptdimensionen einen Score (0–100) und die grobe Kategorie.
-    """
-    dim_values: Dict[str, List[int]] = {code: [] for code in DIMENSION_LABELS.keys()}
-    dim_items: Dict[str, List[str]] = {code: [] for code in DIMENSION_LABELS.keys()}
-    dim_raw_values: Dict[str, List[int]] = {code: [] for code in DIMENSION_LABELS.keys()}
 
-    for code, value in ratings.items():
-        item_def = ITEM_DEFINITIONS[code]
-        if not item_def.include_in_main_scale:
-            continue
-        dim_code = item_def.dimension_code
-        dim_items[dim_code].append(code)
-        dim_raw_values[dim_code].append(value)
-        final_val = reverse_likert(value) if item_def.reverse_scored else value
-        dim_values[dim_code].append(final_val)
+    Die Summen je Dimension liefert die beim Import generierte Funktion _score_dimensions
+    (flache Ausdrücke statt Schleife); Item-Anzahlen sind Invarianten des Instruments.
+    """
+    sums, raw_sums = _score_dimensions(ratings)
 
     results: Dict[str, Dict[str, Any]] = {}
-    for dim_code, values in dim_values.items():
+    for dim_idx, dim_code in enumerate(_DIM_CODES):
         label = DIMENSION_LABELS[dim_code]
-        
+        num_items = _DIM_COUNTS[dim_idx]
+
         # Sicherheitsprüfung: Jede Dimension muss Items haben
-        if not values:
+        if not num_items:
             raise RuntimeError(f"Keine Items für Dimension '{dim_code}' ({label}) gefunden")
-        
-        mean_val = sum(values) / len(values)
-        raw_mean = sum(dim_raw_values[dim_code]) / len(dim_raw_values[dim_code])
+
+        mean_val = sums[dim_idx] / num_items
+        raw_mean = raw_sums[dim_idx] / num_items
         score = (mean_val - LIKERT_MIN) / (LIKERT_MAX - LIKERT_MIN) * 100.0
         level = classify_score(score)
-        
-        # Anzahl Reverse-Items zählen
-        num_reversed = sum(1 for code in dim_items[dim_code] 
-                          if ITEM_DEFINITIONS[code].reverse_scored)
-        
+        num_reversed = _DIM_NUM_REVERSED[dim_idx]
+
         results[dim_code] = {
             "label": label,
             "score": round(score, 1),
             "level": level,
-            "num_items": len(values),
+            "num_items": num_items,
             "num_reversed": num_reversed,
             "raw_mean": round(raw_mean, 2),
-            "items": sorted(dim_items[dim_code]),
+            "items": _DIM_ITEMS_SORTED[dim_code],
         }
 
     return results
@@ -509,20 +669,15 @@ def compute_chronotype_index(ratings: Dict[str, int]) -> Dict[str, Any]:
     
     Alle 6 Items müssen vorhanden sein (wurde bereits in validate_ratings geprüft).
     """
-    morning_items = ["A8", "A13", "A14", "A15"]
-    evening_items = ["A9", "A16"]
-    
     # Harte Validierung: Alle Items müssen vorhanden sein
+    # Scores direkt als Mittelwerte der festen Item-Sets berechnen (keine Zwischenlisten)
+    r = ratings
     try:
-        morning_vals = [ratings[code] for code in morning_items]
-        evening_vals = [ratings[code] for code in evening_items]
+        morning_score = (r["A8"] + r["A13"] + r["A14"] + r["A15"]) / 4
+        evening_score = (r["A9"] + r["A16"]) / 2
     except KeyError as e:
         raise ValueError(f"Fehlender Chronotyp-Wert für Item {e.args[0]}")
     
-    # Scores berechnen
-    morning_score = sum(morning_vals) / len(morning_vals)
-    evening_score = sum(evening_vals) / len(evening_vals)
-    
     morning_score_100 = (morning_score - LIKERT_MIN) / (LIKERT_MAX - LIKERT_MIN) * 100.0
     evening_score_100 = (evening_score - LIKERT_MIN) / (LIKERT_MAX - LIKERT_MIN) * 100.0
     
@@ -547,8 +702,8 @@ def compute_chronotype_index(ratings: Dict[str, int]) -> Dict[str, Any]:
         "evening_tendency": round(evening_score_100, 1),
         "balance_score": round(balance, 2),
         "interpretation": interpretation,
-        "num_items": len(morning_items) + len(evening_items),
-        "items": morning_items + evening_items,
+        "num_items": 6,
+        "items": ["A8", "A13", "A14", "A15", "A9", "A16"],
     }
 
 
@@ -559,18 +714,16 @@ def compute_additional_indices(ratings: Dict[str, int]) -> Dict[str, Dict[str, A
     indices: Dict[str, Dict[str, Any]] = {}
 
     # Vermeidungsorientierung: M2, M9
-    avoid_items = ["M2", "M9"]
-    if all(code in ratings for code in avoid_items):
-        vals = [ratings[code] for code in avoid_items]
-        mean_val = sum(vals) / len(vals)
+    if "M2" in ratings and "M9" in ratings:
+        mean_val = (ratings["M2"] + ratings["M9"]) / 2
         score = (mean_val - LIKERT_MIN) / (LIKERT_MAX - LIKERT_MIN) * 100.0
         indices["motivation_avoidance"] = {
             "label": "Vermeidungsorientierung (Motivation)",
             "score": round(score, 1),
             "level": classify_score(score),
-            "num_items": len(vals),
+            "num_items": 2,
             "raw_mean": round(mean_val, 2),
-            "items": avoid_items,
+            "items": ["M2", "M9"],
         }
 
     # Chronotyp (erweitert in Version 0.2)
@@ -601,11 +754,11 @@ def compute_profile(ratings: Dict[str, int], profile_id: Optional[str] = None) -
         "response_quality": quality,
         "meta": {
             "version": VERSION,
-            "num_items_instrument": len(ITEM_DEFINITIONS),
+            "num_items_instrument": _INSTRUMENT_SIZE,
             "num_items_answered": len(ratings),
-            "num_items_main_scales": sum(d["num_items"] for d in dimensions.values()),
-            "num_items_additional": len(INDEX_ITEMS_DEFINED),
-            "num_reversed_total": sum(d["num_reversed"] for d in dimensions.values()),
+            "num_items_main_scales": _NUM_MAIN_ITEMS,
+            "num_items_additional": _NUM_INDEX_ITEMS,
+            "num_reversed_total": _NUM_REVERSED_TOTAL,
             "likert_min": LIKERT_MIN,
             "likert_max": LIKERT_MAX,
             "score_min": 0,
@@ -615,25 +768,84 @@ def compute_profile(ratings: Dict[str, int], profile_id: Optional[str] = None) -
     return profile
 
 
+# ---------------------------------------------------------------------------
+# Batch-Auswertung (optional mit numpy)
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def _batch_tables():
+    """
+    Importiert numpy bei Bedarf und baut einmalig Reverse-Maske, Dimensions-Zuordnung
+    (One-Hot, nur Hauptskalen) und Item-Anzahlen als Arrays.
+    """
+    try:
+        import numpy as np
+    except ImportError as exc:
+        raise ImportError(
+            "compute_scores_batch benötigt numpy. Installieren mit: pip install numpy"
+        ) from exc
+
+    rev_mask = np.array(_REV_VEC, dtype=bool)
+    dim_onehot = np.zeros((len(_ITEM_ORDER), len(_DIM_CODES)), dtype=np.float64)
+    for pos, (dim_idx, main) in enumerate(zip(_DIM_VEC, _MAIN_MASK)):
+        if main:
+            dim_onehot[pos, dim_idx] = 1.0
+    dim_counts = np.array(_DIM_COUNTS, dtype=np.float64)
+    return np, rev_mask, dim_onehot, dim_counts
+
+
+def compute_scores_batch(matrix: Any) -> Any:
+    """
+    Berechnet die 6 Dimensions-Scores für viele Antwortsätze in einem Schritt.
+
+    matrix: (N, 88)-Matrix mit Ratings in ITEM_DEFINITIONS-Reihenfolge, z.B. ein numpy-Array
+            oder eine Liste von ratings_to_array()-Ergebnissen.
+    Rückgabe: numpy-Array (N, 6) mit ungerundeten Scores (0–100); Spalten in der
+              Reihenfolge von DIMENSION_LABELS. Identisch zu compute_profile vor dem Runden.
+    """
+    np, rev_mask, dim_onehot, dim_counts = _batch_tables()
+
+    mat = np.asarray(matrix)
+    if mat.ndim != 2 or mat.shape[1] != len(_ITEM_ORDER):
+        raise ValueError(
+            f"Erwartet Matrix der Form (N, {len(_ITEM_ORDER)}), erhalten: {mat.shape}"
+        )
+    if not np.issubdtype(mat.dtype, np.integer):
+        raise TypeError(f"Ratings müssen ganzzahlig sein, erhalten: dtype {mat.dtype}")
+    if mat.size and (mat.min() < LIKERT_MIN or mat.max() > LIKERT_MAX):
+        raise ValueError(f"Ratings außerhalb des erlaubten Bereichs {LIKERT_MIN}-{LIKERT_MAX}")
+
+    mat = mat.astype(np.int8, copy=False)
+    final = np.where(rev_mask, _LIKERT_SUM - mat, mat).astype(np.float64)
+    means = (final @ dim_onehot) / dim_counts
+    return (means - LIKERT_MIN) / (LIKERT_MAX - LIKERT_MIN) * 100.0
+
+
 # ---------------------------------------------------------------------------
 # Visualisierung & Report
 # ---------------------------------------------------------------------------
 
+# Vorgefertigte Textbausteine: Trennlinien und ASCII-Balken für 0-50 Zeichen (Score / 2)
+_RULE_80 = "=" * 80
+_DASH_80 = "-" * 80
+_BARS = tuple("█" * length for length in range(51))
+
+
 def generate_text_report(profile: Dict[str, Any]) -> str:
     """
     Erzeugt einen textuellen Report mit ASCII-Balkendiagrammen.
     """
     lines = []
-    lines.append("=" * 80)
+    lines.append(_RULE_80)
     lines.append(f"LERNENERGIE-PROFIL (Version {profile['meta']['version']})")
     lines.append(f"Profil-ID: {profile['id']}")
-    lines.append("=" * 80)
+    lines.append(_RULE_80)
     lines.append("")
     
     # Response Quality
     quality = profile.get("response_quality", {})
     lines.append("ANTWORTQUALITÄT")
-    lines.append("-" * 80)
+    lines.append(_DASH_80)
     lines.append(f"Anzahl verschiedener Antworten: {quality.get('num_unique_responses', 'N/A')}")
     lines.append(f"Antwortvariation: {quality.get('response_variance', 'N/A')}")
     lines.append(f"Durchschnittliche Antwort: {quality.get('mean_response', 'N/A')}")
@@ -644,16 +856,17 @@ def generate_text_report(profile: Dict[str, Any]) -> str:
     
     # Dimensionen
     lines.append("HAUPTDIMENSIONEN (0-100 Skala)")
-    lines.append("-" * 80)
+    lines.append(_DASH_80)
     
     dimensions = profile["dimensions"]
+    get_dimension = dimensions.get
     max_label_len = max(len(d["label"]) for d in dimensions.values())
     
     # Definierte Reihenfolge der Dimensionen
     dim_order = ["attention", "sensory", "social", "executive", "motivation", "regulation"]
     
     for dim_code in dim_order:
-        dim = dimensions.get(dim_code)
+        dim = get_dimension(dim_code)
         if dim is None:
             continue  # Defensive: falls Dimension fehlt
         
@@ -664,8 +877,7 @@ def generate_text_report(profile: Dict[str, Any]) -> str:
         num_reversed = dim["num_reversed"]
         
         # ASCII-Balken
-        bar_length = int(score / 2)  # 0-50 Zeichen
-        bar = "█" * bar_length
+        bar = _BARS[min(max(int(score / 2), 0), 50)]  # 0-50 Zeichen, auch bei Scores außerhalb 0-100
         
         lines.append(f"{label:<{max_label_len}} │ {bar} {score:5.1f} ({level})")
         lines.append(f"{'':<{max_label_len}} │ Items: {num_items} (davon {num_reversed} reverse)")
@@ -673,7 +885,7 @@ def generate_text_report(profile: Dict[str, Any]) -> str:
     
     # Zusatzindizes
     lines.append("ZUSATZINDIZES")
-    lines.append("-" * 80)
+    lines.append(_DASH_80)
     
     additional = profile.get("additional_indices", {})
     
@@ -693,19 +905,19 @@ def generate_text_report(profile: Dict[str, Any]) -> str:
         lines.append(f"  Interpretation: {chrono['interpretation']}")
         lines.append("")
     
-    lines.append("=" * 80)
+    lines.append(_RULE_80)
     lines.append("NÄCHSTE SCHRITTE")
-    lines.append("-" * 80)
+    lines.append(_DASH_80)
     lines.append("1. Dieses Profil mit einer KI analysieren lassen (datenschutzkonform)")
     lines.append("2. Konkrete Lernstrategien auf Basis des Profils entwickeln")
     lines.append("3. Profil bei Bedarf mit Lehrenden oder Lerncoaches besprechen")
-    lines.append("=" * 80)
+    lines.append(_RULE_80)
     
     # Instrument-Metadaten für Transparenz
     meta = profile.get("meta", {})
     lines.append("")
     lines.append("INSTRUMENT-METADATEN")
-    lines.append("-" * 80)
+    lines.append(_DASH_80)
     lines.append(f"Instrument-Items: {meta.get('num_items_instrument', 'N/A')}")
     lines.append(f"Beantwortete Items: {meta.get('num_items_answered', 'N/A')}")
     lines.append(f"Hauptskalen-Items: {meta.get('num_items_main_scales', 'N/A')}")
@@ -713,16 +925,28 @@ def generate_text_report(profile: Dict[str, Any]) -> str:
     lines.append(f"Zusatzindex-Items: {meta.get('num_items_additional', 'N/A')}")
     lines.append(f"Likert-Skala: {meta.get('likert_min', 'N/A')}-{meta.get('likert_max', 'N/A')}")
     lines.append(f"Score-Bereich: {meta.get('score_min', 'N/A')}-{meta.get('score_max', 'N/A')}")
-    lines.append("=" * 80)
+    lines.append(_RULE_80)
     
     return "\n".join(lines)
 
 
+def dump_profile_json(profile: Dict[str, Any]) -> bytes:
+    """
+    Serialisiert ein Profil als eingerücktes UTF-8-JSON.
+    Nutzt orjson, falls installiert; die Ausgabe ist identisch zu json.dumps(indent=2).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(profile, option=orjson.OPT_INDENT_2)
+    return json.dumps(profile, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    import argparse
+
     parser = argparse.ArgumentParser(
         description=(
             "Berechne ein Lernenergie-Profil (6 Dimensionen + Zusatzindizes) "
@@ -751,6 +975,12 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         type=Path,
         help="Optionaler Pfad für Text-Report (ASCII-Visualisierung).",
     )
+    parser.add_argument(
+        "--output-root",
+        type=Path,
+        default=Path("auswertung"),
+        help="Basisordner, unter dem der Timestamp-Ordner angelegt wird (Standard: ./auswertung).",
+    )
     parser.add_argument(
         "--quiet",
         "-q",
@@ -760,7 +990,10 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def main(argv: Optional[List[str]] = None) -> None:
+def main(argv: Optional[List[str]] = None) -> Path:
+    """CLI-Einstieg. Gibt den erzeugten Ausgabeordner zurück."""
+    from datetime import datetime
+
     args = parse_args(argv)
     input_path: Path = args.input_csv
 
@@ -777,7 +1010,7 @@ def main(argv: Optional[List[str]] = None) -> None:
 
         # Ausgabeordner erzeugen: Auswertung/YYYY-MM-DD_HH-MM-SS/
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        output_dir = Path("auswertung") / timestamp
+        output_dir = args.output_root / timestamp
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Wenn --output gesetzt wurde → Dateiname übernehmen, aber im neuen Ordner speichern
@@ -800,13 +1033,20 @@ def main(argv: Optional[List[str]] = None) -> None:
         raise SystemExit(2)
     
     # JSON-Ausgabe
-    json_str = json.dumps(profile, ensure_ascii=False, indent=2)
+    json_bytes = dump_profile_json(profile)
     if args.output:
-        json_output_path.write_text(json_str, encoding="utf-8")
+        json_output_path.write_bytes(json_bytes)
         if not args.quiet:
             print(f"✓ JSON-Profil gespeichert: {json_output_path}")
     elif not args.quiet:
-        print(json_str)
+        stdout_buffer = getattr(sys.stdout, "buffer", None)
+        if stdout_buffer is not None:
+            # Bytes direkt ausgeben, ohne Umweg über einen decodierten str
+            sys.stdout.flush()
+            stdout_buffer.write(json_bytes + b"\n")
+            stdout_buffer.flush()
+        else:
+            print(json_bytes.decode("utf-8"))
     
     # Text-Report
     if args.report or not args.output:
@@ -818,6 +1058,8 @@ def main(argv: Optional[List[str]] = None) -> None:
         elif not args.quiet and not args.output:
             print("\n" + report_text)
 
+    return output_dir
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -16,7 +16,8 @@ Der Orchestrator respektiert die eigenständige Ordnerlogik der Module:
 
 Der Orchestrator:
 1. Ruft Module mit minimalen Argumenten auf
-2. Ermittelt die tatsächlichen Output-Locations
+   (auswertung/visualize in-process, Tests/Validierung als Subprocess)
+2. Übernimmt die von den Modulen zurückgegebenen Output-Locations
 3. Erstellt eine Session-Index-Datei mit Links zu allen Outputs
 
 QUICK START
@@ -55,18 +56,33 @@ Date: 2025-11
 """
 
 import argparse
+import contextlib
+import importlib
+import io
 import json
 import subprocess
 import sys
 import os
 import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
 
+try:
+    import orjson  # Optional: schnellere JSON-Serialisierung des Session-Index
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+# __slots__ statt __dict__ pro Instanz (dataclass(slots=True) erst ab Python 3.10)
+_DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class WorkflowConfig:
     """Zentrale Konfiguration für alle Scripts"""
     csv_path: Path
@@ -80,7 +96,7 @@ class WorkflowConfig:
             self.profile_id = self.csv_path.stem
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class StageResult:
     """Ergebnis einer Workflow-Stage"""
     stage_name: str
@@ -107,12 +123,31 @@ class LernprofilOrchestrator:
         'validate': ['test', 'validation']
     }
     
-    def __init__(self, config: WorkflowConfig, timeout: int = 300):
+    # Menü-Auswahl → Workflow (unveränderlich, einmal pro Klasse)
+    _MENU_MAP = MappingProxyType({
+        '1': 'minimal',
+        '2': 'basic',
+        '3': 'full',
+        '4': 'validate'
+    })
+    
+    # Zeilenfilter für die Zusammenfassungen der Test-/Validierungs-Ausgabe
+    _TEST_SUMMARY_RE = re.compile(r'^(?:.*TEST-ZUSAMMENFASSUNG.*|Tests .*|Erfolgreich.*)$', re.M)
+    _VALIDATION_STATUS_RE = re.compile(r'^.*(?:✅|❌|PRODUCTION READY).*$', re.M)
+    
+    def __init__(self, config: WorkflowConfig, timeout: int = 300, pretty_index: bool = False):
         self.config = config
-        self.timeout = timeout
+        self.timeout = timeout  # gilt nur für Subprocess-Stages (Tests/Validierung)
+        self.pretty_index = pretty_index  # Session-Index eingerückt statt kompakt schreiben
         self.results: List[StageResult] = []
         self.session_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
+        # Arbeitsverzeichnis einmalig festhalten (Basis für auswertung/, charts/ und lernprofil_sessions/)
+        self._cwd = Path.cwd()
+        
+        # Umgebung für Subprocesses einmalig aufbauen statt pro Aufruf zu kopieren
+        self._child_env = {**os.environ, 'PYTHONIOENCODING': 'utf-8'}
+        
         # Scripts im gleichen Verzeichnis wie orchestrator
         self.script_dir = Path(__file__).parent.resolve()
         self.scripts = {
@@ -131,9 +166,13 @@ class LernprofilOrchestrator:
     
     def _validate_scripts(self) -> None:
         """Prüft ob alle benötigten Scripts vorhanden sind"""
+        # Ein Verzeichnis-Listing statt eines stat()-Aufrufs pro Script
+        with os.scandir(self.script_dir) as entries:
+            present = {e.name for e in entries if e.is_file()}
+        
         missing = []
         for name, path in self.scripts.items():
-            if not path.exists():
+            if path.name not in present:
                 missing.append(f"{name}: {path}")
         
         if missing:
@@ -146,7 +185,7 @@ class LernprofilOrchestrator:
         """
         Führt einen Subprocess aus und captured Output.
         """
-        start_time = datetime.now()
+        start = time.perf_counter()  # monoton, ohne datetime-Allokation
         
         print(f"\n{'─'*60}")
         print(f"▶ {stage_name}")
@@ -154,27 +193,29 @@ class LernprofilOrchestrator:
         print(f"  Command: {' '.join(str(c) for c in cmd)}")
         
         try:
+            # Output als Bytes lesen und am Ende einmal dekodieren (kein inkrementeller Decoder);
+            # Zeilenenden selbst vereinheitlichen, da ohne text=True keine Newline-Übersetzung erfolgt
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=self.timeout,
-                encoding='utf-8',
-                env={**os.environ, 'PYTHONIOENCODING': 'utf-8'}
+                env=self._child_env
             )
             
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start
+            stdout = result.stdout.decode('utf-8', 'replace').replace('\r\n', '\n')
+            stderr = result.stderr.decode('utf-8', 'replace').replace('\r\n', '\n')
             
             if result.returncode != 0:
-                error_msg = result.stderr.splitlines()[0] if result.stderr else "Unknown error"
+                error_msg = stderr.splitlines()[0] if stderr else "Unknown error"
                 print(f"  ❌ Fehlgeschlagen: {error_msg}")
                 return StageResult(
                     stage_name=stage_name,
                     success=False,
                     duration_seconds=duration,
                     error_message=error_msg,
-                    stdout=result.stdout,
-                    stderr=result.stderr
+                    stdout=stdout,
+                    stderr=stderr
                 )
             
             print(f"  ✓ Erfolgreich ({duration:.1f}s)")
@@ -183,12 +224,12 @@ class LernprofilOrchestrator:
                 stage_name=stage_name,
                 success=True,
                 duration_seconds=duration,
-                stdout=result.stdout,
-                stderr=result.stderr
+                stdout=stdout,
+                stderr=stderr
             )
             
         except subprocess.TimeoutExpired:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start
             error_msg = f"Timeout nach {self.timeout}s"
             print(f"  ❌ {error_msg}")
             return StageResult(
@@ -198,7 +239,7 @@ class LernprofilOrchestrator:
                 error_message=error_msg
             )
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start
             print(f"  ❌ Fehler: {e}")
             return StageResult(
                 stage_name=stage_name,
@@ -207,59 +248,110 @@ class LernprofilOrchestrator:
                 error_message=str(e)
             )
     
-    def _find_latest_subdir(self, base_dir: Path) -> Optional[Path]:
-        """Findet das neueste Timestamp-Unterverzeichnis."""
-        if not base_dir.exists():
-            return None
-        
-        subdirs = [d for d in base_dir.iterdir() if d.is_dir()]
-        if not subdirs:
-            return None
-        
-        # Sortiere nach Name (Timestamp-Format sortiert chronologisch)
-        subdirs.sort(key=lambda d: d.name, reverse=True)
-        return subdirs[0]
+    def _import_stage_module(self, module_name: str, stage_name: str):
+        """
+        Importiert ein Stage-Modul aus script_dir erst bei Bedarf.
+        
+        Gibt (modul, None) zurück oder (None, StageResult) mit einer klaren
+        Fehlermeldung, wenn der Import scheitert (z.B. Syntax-/Abhängigkeitsfehler).
+        """
+        if str(self.script_dir) not in sys.path:
+            sys.path.insert(0, str(self.script_dir))
+        try:
+            return importlib.import_module(module_name), None
+        except Exception as e:
+            error_msg = f"Modul {module_name} konnte nicht importiert werden: {e}"
+            print(f"\n  ❌ {stage_name}: {error_msg}")
+            return None, StageResult(
+                stage_name=stage_name,
+                success=False,
+                duration_seconds=0.0,
+                error_message=error_msg
+            )
     
-    def _parse_output_path_from_stdout(self, stdout: str, pattern: str) -> Optional[Path]:
-        """Extrahiert einen Pfad aus stdout anhand eines Patterns."""
-        for line in stdout.splitlines():
-            if pattern in line:
-                # Extrahiere Pfad nach dem Pattern
-                match = re.search(r':\s*(.+)$', line)
-                if match:
-                    return Path(match.group(1).strip())
-        return None
+    def _run_in_process(self, func, args: List[Any], stage_name: str) -> StageResult:
+        """
+        Ruft eine Modul-Funktion direkt im laufenden Interpreter auf.
+        
+        stdout/stderr werden wie beim Subprocess mitgeschnitten, SystemExit
+        mit Code != 0 gilt als Fehler. Ein Timeout gibt es in-process nicht.
+        Gibt die Funktion einen Pfad zurück, wird er als output_dir übernommen.
+        """
+        start = time.perf_counter()
+        
+        print(f"\n{'─'*60}")
+        print(f"▶ {stage_name}")
+        print(f"{'─'*60}")
+        print(f"  Aufruf: {func.__module__}.{func.__name__}({', '.join(str(a) for a in args)})")
+        
+        stdout_buffer = io.StringIO()
+        stderr_buffer = io.StringIO()
+        error_msg = None
+        returned = None
+        
+        try:
+            with contextlib.redirect_stdout(stdout_buffer), contextlib.redirect_stderr(stderr_buffer):
+                returned = func(*args)
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                stderr = stderr_buffer.getvalue()
+                error_msg = stderr.splitlines()[0] if stderr else f"Exit-Code {e.code}"
+        except Exception as e:
+            error_msg = str(e)
+        
+        duration = time.perf_counter() - start
+        
+        if error_msg is not None:
+            print(f"  ❌ Fehlgeschlagen: {error_msg}")
+            return StageResult(
+                stage_name=stage_name,
+                success=False,
+                duration_seconds=duration,
+                error_message=error_msg,
+                stdout=stdout_buffer.getvalue(),
+                stderr=stderr_buffer.getvalue()
+            )
+        
+        print(f"  ✓ Erfolgreich ({duration:.1f}s)")
+        
+        return StageResult(
+            stage_name=stage_name,
+            success=True,
+            duration_seconds=duration,
+            output_dir=Path(returned).resolve() if returned is not None else None,
+            stdout=stdout_buffer.getvalue(),
+            stderr=stderr_buffer.getvalue()
+        )
     
     def _stage_compute(self) -> StageResult:
         """
         Stage: Profil berechnen
         
-        Ruft auswertung.py auf und ermittelt danach die Output-Location.
-        Das Modul erstellt selbst einen Timestamp-Ordner unter ./auswertung/
+        Ruft auswertung.main() in-process auf. Das Modul erstellt selbst einen
+        Timestamp-Ordner unter auswertung/ im Startverzeichnis und gibt ihn zurück.
         """
-        cmd = [
-            sys.executable,
-            str(self.scripts['auswertung']),
+        argv = [
             str(self.config.csv_path),
             '--id', self.config.profile_id,
             '--output', 'profil.json',    # Modul nutzt nur Dateinamen
             '--report', 'bericht.txt',    # und legt eigenen Ordner an
+            '--output-root', str(self._cwd / 'auswertung'),
             '--quiet'                      # Keine stdout-Duplikation
         ]
         
-        result = self._run_subprocess(cmd, "Profil-Berechnung")
+        auswertung, failed = self._import_stage_module('auswertung', "Profil-Berechnung")
+        if failed:
+            return failed
+        
+        result = self._run_in_process(auswertung.main, [argv], "Profil-Berechnung")
         
         if result.success:
-            # Finde den neuesten Output-Ordner
-            auswertung_base = Path.cwd() / "auswertung"
-            latest_dir = self._find_latest_subdir(auswertung_base)
+            output_dir = result.output_dir
             
-            if latest_dir:
-                result.output_dir = latest_dir
-                
+            if output_dir:
                 # Suche nach Output-Dateien
-                profil_json = latest_dir / "profil.json"
-                bericht_txt = latest_dir / "bericht.txt"
+                profil_json = output_dir / "profil.json"
+                bericht_txt = output_dir / "bericht.txt"
                 
                 if profil_json.exists():
                     self.profil_json_path = profil_json
@@ -289,28 +381,28 @@ class LernprofilOrchestrator:
                 error_message="profil.json nicht gefunden (Stage compute fehlgeschlagen?)"
             )
         
-        cmd = [
-            sys.executable,
-            str(self.scripts['visualize']),
-            str(self.profil_json_path)
-        ]
+        auswertung_visualize, failed = self._import_stage_module('auswertung_visualize', "Visualisierung")
+        if failed:
+            return failed
         
-        result = self._run_subprocess(cmd, "Visualisierung")
+        result = self._run_in_process(
+            auswertung_visualize.visualize_profile,
+            [self.profil_json_path, self._cwd / "charts"],
+            "Visualisierung"
+        )
         
         if result.success:
-            # Finde den neuesten Charts-Ordner
-            charts_base = Path.cwd() / "charts"
-            latest_dir = self._find_latest_subdir(charts_base)
+            output_dir = result.output_dir
             
-            if latest_dir:
-                result.output_dir = latest_dir
-                self.charts_dir = latest_dir
+            if output_dir:
+                self.charts_dir = output_dir
                 
-                # Liste alle generierten Dateien
-                for file in latest_dir.iterdir():
-                    if file.is_file():
-                        result.output_files.append(file)
-                        print(f"  → {file.name}")
+                # Liste alle generierten Dateien (DirEntry.is_file() nutzt den Typ aus dem Listing)
+                with os.scandir(output_dir) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            result.output_files.append(Path(entry.path))
+                            print(f"  → {entry.name}")
             else:
                 print("  ⚠ Charts-Verzeichnis nicht gefunden")
         
@@ -327,9 +419,8 @@ class LernprofilOrchestrator:
         
         # Zeige Test-Zusammenfassung
         if result.stdout:
-            for line in result.stdout.splitlines():
-                if 'TEST-ZUSAMMENFASSUNG' in line or line.startswith('Tests ') or line.startswith('Erfolgreich'):
-                    print(f"  {line}")
+            for line in self._TEST_SUMMARY_RE.findall(result.stdout):
+                print(f"  {line}")
         
         return result
     
@@ -344,9 +435,8 @@ class LernprofilOrchestrator:
         
         # Zeige Validierungs-Status
         if result.stdout:
-            for line in result.stdout.splitlines():
-                if '✅' in line or '❌' in line or 'PRODUCTION READY' in line:
-                    print(f"  {line}")
+            for line in self._VALIDATION_STATUS_RE.findall(result.stdout):
+                print(f"  {line}")
         
         return result
     
@@ -389,8 +479,9 @@ class LernprofilOrchestrator:
         Schreibt Session-Index als JSON.
         
         Der Index verweist auf die tatsächlichen Output-Locations der Module.
+        Er wird maschinell gelesen und daher kompakt geschrieben (--pretty: eingerückt).
         """
-        sessions_dir = Path.cwd() / "lernprofil_sessions"
+        sessions_dir = self._cwd / "lernprofil_sessions"
         sessions_dir.mkdir(parents=True, exist_ok=True)
         
         index = {
@@ -419,7 +510,16 @@ class LernprofilOrchestrator:
         }
         
         index_path = sessions_dir / f"session_{self.session_timestamp}.json"
-        index_path.write_text(json.dumps(index, indent=2, ensure_ascii=False), encoding='utf-8')
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_INDENT_2 if self.pretty_index else 0
+            index_path.write_bytes(orjson.dumps(index, option=option))
+        else:
+            # json.dump schreibt in vielen kleinen Stücken → großer Puffer bündelt die Writes
+            with index_path.open('w', encoding='utf-8', buffering=1 << 16) as f:
+                if self.pretty_index:
+                    json.dump(index, f, indent=2, ensure_ascii=False)
+                else:
+                    json.dump(index, f, separators=(',', ':'), ensure_ascii=False)
         
         print(f"\n  Session-Index: {index_path}")
     
@@ -478,19 +578,12 @@ class LernprofilOrchestrator:
         while True:
             choice = input("\nAuswahl (1-4 oder Q): ").strip().upper()
             
-            workflow_map = {
-                '1': 'minimal',
-                '2': 'basic',
-                '3': 'full',
-                '4': 'validate'
-            }
-            
             if choice == 'Q':
                 print("Beendet.")
                 return
             
-            if choice in workflow_map:
-                workflow = workflow_map[choice]
+            workflow = self._MENU_MAP.get(choice)
+            if workflow is not None:
                 success = self.run_workflow(workflow)
                 
                 if success:
@@ -509,6 +602,9 @@ def interactive_setup() -> WorkflowConfig:
     print("LERNPROFIL-ORCHESTRATOR - SETUP")
     print("═"*60)
     
+    # CSV-Dateien im aktuellen Verzeichnis einmalig suchen (nicht bei jeder Eingabe neu)
+    csvs = list(Path.cwd().glob("*.csv"))
+    
     while True:
         print("\nCSV-Datei mit Fragebogen-Antworten:")
         print("  Format: item_code, rating | 88 Zeilen | Likert 1-5")
@@ -518,8 +614,6 @@ def interactive_setup() -> WorkflowConfig:
             csv_input = input("  Pfad zur CSV: ").strip()
             
             if not csv_input:
-                # Suche im aktuellen Verzeichnis
-                csvs = list(Path.cwd().glob("*.csv"))
                 if csvs:
                     print("\n  Gefundene CSV-Dateien:")
                     for i, csv in enumerate(csvs, 1):
@@ -571,7 +665,10 @@ Beispiele:
     parser.add_argument('--id', dest='profile_id',
                        help='Profile-ID (Standard: CSV-Dateiname)')
     parser.add_argument('--timeout', type=int, default=300,
-                       help='Timeout pro Stage (Standard: 300s)')
+                       help='Timeout pro Subprocess-Stage, d.h. Tests/Validierung '
+                            '(Standard: 300s; Berechnung/Visualisierung laufen in-process ohne Timeout)')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Session-Index eingerückt schreiben (Standard: kompakt)')
     
     args = parser.parse_args()
     
@@ -591,7 +688,11 @@ Beispiele:
     
     # Orchestrator starten
     try:
-        orchestrator = LernprofilOrchestrator(config, timeout=args.timeout)
+        orchestrator = LernprofilOrchestrator(
+            config,
+            timeout=args.timeout,
+            pretty_index=args.pretty
+        )
     except FileNotFoundError as e:
         print(f"❌ {e}")
         return 1
@@ -10,13 +10,22 @@ Testet die Kernfunktionalität des Auswertungssystems:
 - Extremprofile
 """
 
+import base64
+import contextlib
+import io
+import json
+import os
 import unittest
 import sys
+import tempfile
 from pathlib import Path
+from unittest import mock
 
 # Scoring-Modul importieren
 sys.path.insert(0, str(Path(__file__).parent))
 import auswertung as scoring
+import auswertung_visualize as visualize
+import auswertung_orchestrator as orchestrator
 
 
 class TestScoringBasics(unittest.TestCase):
@@ -45,6 +54,27 @@ class TestScoringBasics(unittest.TestCase):
         self.assertEqual(scoring.classify_score(100.0), "hoch")
 
 
+class TestDimensionScorer(unittest.TestCase):
+    """Tests für die generierte Scoring-Funktion gegen eine direkte Referenzrechnung."""
+    
+    def test_matches_reference_computation(self):
+        """Teste Scores und Rohmittelwerte gegen Reverse-Coding per reverse_likert."""
+        ratings = {code: (i * 7 % 5) + 1 for i, code in enumerate(scoring.ITEM_DEFINITIONS)}
+        dimensions = scoring.compute_dimension_scores(ratings)
+        
+        for dim_code in scoring.DIMENSION_LABELS:
+            items = [d for d in scoring.ITEM_DEFINITIONS.values()
+                     if d.dimension_code == dim_code and d.include_in_main_scale]
+            final = [scoring.reverse_likert(ratings[d.code]) if d.reverse_scored else ratings[d.code]
+                     for d in items]
+            raw = [ratings[d.code] for d in items]
+            expected_score = (sum(final) / len(final) - 1) / 4 * 100.0
+            
+            self.assertEqual(dimensions[dim_code]["score"], round(expected_score, 1))
+            self.assertEqual(dimensions[dim_code]["raw_mean"], round(sum(raw) / len(raw), 2))
+            self.assertEqual(list(dimensions[dim_code]["items"]), sorted(d.code for d in items))
+
+
 class TestExtremProfiles(unittest.TestCase):
     """Tests für Extremprofile (alle niedrig/hoch)."""
     
@@ -285,6 +315,124 @@ class TestItemCounts(unittest.TestCase):
                                "Motivation sollte mindestens 4 Reverse-Items haben")
 
 
+try:
+    import numpy  # noqa: F401
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class TestRatingsArray(unittest.TestCase):
+    """Tests für die kompakte array('b')-Darstellung der Ratings."""
+    
+    def test_roundtrip_preserves_ratings(self):
+        """Teste, dass ratings_from_array(ratings_to_array(r)) == r gilt."""
+        ratings = {code: (i % 5) + 1 for i, code in enumerate(scoring.ITEM_DEFINITIONS)}
+        packed = scoring.ratings_to_array(ratings)
+        
+        self.assertEqual(len(packed), 88)
+        self.assertEqual(packed.itemsize, 1)
+        self.assertEqual(scoring.ratings_from_array(packed), ratings)
+    
+    def test_wrong_length_raises(self):
+        """Teste, dass eine falsche Länge einen ValueError wirft."""
+        with self.assertRaises(ValueError):
+            scoring.ratings_from_array([3] * 87)
+    
+    def test_invalid_values_raise(self):
+        """Teste, dass Werte außerhalb 1-5 bzw. nicht-ganzzahlige Werte abgelehnt werden."""
+        with self.assertRaises(ValueError):
+            scoring.ratings_from_array([9] * 88)
+        with self.assertRaises(TypeError):
+            scoring.ratings_from_array([3.0] * 88)
+    
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy nicht installiert")
+    def test_numpy_row_gives_python_ints(self):
+        """Teste, dass eine numpy-int8-Zeile Python-ints liefert, die compute_profile akzeptiert."""
+        import numpy as np
+        ratings = scoring.ratings_from_array(np.full(88, 4, dtype=np.int8))
+        
+        self.assertTrue(all(type(v) is int for v in ratings.values()))
+        self.assertEqual(scoring.compute_profile(ratings)["meta"]["num_items_answered"], 88)
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy nicht installiert")
+class TestScoresBatch(unittest.TestCase):
+    """Tests für compute_scores_batch (vektorisierte Auswertung)."""
+    
+    def test_batch_matches_single_profiles(self):
+        """Teste, dass Batch-Scores den Einzelprofilen entsprechen."""
+        rows = []
+        for shift in range(5):
+            ratings = {code: ((i + shift) % 5) + 1 for i, code in enumerate(scoring.ITEM_DEFINITIONS)}
+            rows.append(scoring.ratings_to_array(ratings))
+        scores = scoring.compute_scores_batch(rows)
+        
+        self.assertEqual(scores.shape, (5, 6))
+        for row, row_scores in zip(rows, scores):
+            profile = scoring.compute_profile(scoring.ratings_from_array(row))
+            for dim_code, score in zip(scoring.DIMENSION_LABELS, row_scores):
+                self.assertEqual(profile["dimensions"][dim_code]["score"], round(float(score), 1))
+    
+    def test_invalid_shape_and_range_raise(self):
+        """Teste, dass falsche Form oder Werte außerhalb 1-5 einen ValueError werfen."""
+        with self.assertRaises(ValueError):
+            scoring.compute_scores_batch([[3] * 87])
+        with self.assertRaises(ValueError):
+            scoring.compute_scores_batch([[6] * 88])
+
+
+class TestCsvLoading(unittest.TestCase):
+    """Tests für load_ratings_from_csv."""
+    
+    def _write_csv(self, content: str) -> Path:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        path = Path(tmpdir.name) / "antworten.csv"
+        path.write_text(content, encoding="utf-8")
+        return path
+    
+    def test_extra_columns_and_blank_lines_ignored(self):
+        """Teste, dass Zusatzspalten und Leerzeilen ignoriert werden."""
+        lines = ["dimension,item_code,item_text,rating"]
+        for code in scoring.ITEM_DEFINITIONS:
+            lines.append(f'x,{code},"Text, mit Komma",4')
+            lines.append("")
+        ratings = scoring.load_ratings_from_csv(self._write_csv("\n".join(lines)))
+        
+        self.assertEqual(len(ratings), 88)
+        self.assertTrue(all(v == 4 for v in ratings.values()))
+    
+    def test_minimal_format_without_quoting(self):
+        """Teste das Minimalformat item_code,rating (auch mit CRLF-Zeilenenden)."""
+        lines = ["item_code,rating"] + [f"{code},2" for code in scoring.ITEM_DEFINITIONS]
+        ratings = scoring.load_ratings_from_csv(self._write_csv("\r\n".join(lines) + "\r\n"))
+        
+        self.assertEqual(ratings, dict.fromkeys(scoring.ITEM_DEFINITIONS, 2))
+    
+    def test_whitespace_only_lines_ignored(self):
+        """Teste, dass Zeilen nur aus Leerzeichen/Tabs wie Leerzeilen übersprungen werden."""
+        lines = ["item_code,rating"]
+        for code in scoring.ITEM_DEFINITIONS:
+            lines.append(f"{code},5")
+            lines.append("   ")
+        lines.append("\t")
+        ratings = scoring.load_ratings_from_csv(self._write_csv("\n".join(lines)))
+        self.assertEqual(ratings, dict.fromkeys(scoring.ITEM_DEFINITIONS, 5))
+        
+        # Gleiches Verhalten auf dem Pfad mit csv-Modul (Quoting vorhanden)
+        quoted = ["item_code,item_text,rating"] + [f'{code},"Text",5\n   ' for code in scoring.ITEM_DEFINITIONS]
+        ratings = scoring.load_ratings_from_csv(self._write_csv("\n".join(quoted)))
+        self.assertEqual(ratings, dict.fromkeys(scoring.ITEM_DEFINITIONS, 5))
+    
+    def test_missing_columns_raises(self):
+        """Teste, dass fehlende Pflichtspalten einen ValueError werfen."""
+        path = self._write_csv("item_code,wert\nA1,3\n")
+        with self.assertRaises(ValueError) as ctx:
+            scoring.load_ratings_from_csv(path)
+        self.assertIn("Spalten", str(ctx.exception))
+
+
 class TestMetadataConsistency(unittest.TestCase):
     """Tests für Konsistenz der Metadaten."""
     
@@ -300,6 +448,289 @@ class TestMetadataConsistency(unittest.TestCase):
         self.assertEqual(meta["num_items_main_scales"], 80)
         self.assertEqual(meta["num_items_additional"], 8)
         self.assertEqual(meta["num_reversed_total"], 27)
+    
+    def test_dimension_grouping_matches_profile(self):
+        """Teste, dass BY_DIMENSION/REVERSE_COUNT_BY_DIM zu den Profilangaben passen."""
+        ratings = {code: 3 for code in scoring.ITEM_DEFINITIONS.keys()}
+        profile = scoring.compute_profile(ratings)
+        
+        for dim_code, dim in profile["dimensions"].items():
+            self.assertEqual(len(scoring.BY_DIMENSION[dim_code]), dim["num_items"])
+            self.assertEqual(scoring.REVERSE_COUNT_BY_DIM[dim_code], dim["num_reversed"])
+        self.assertEqual(sum(scoring.REVERSE_COUNT_BY_DIM.values()), 27)
+    
+    def test_profile_values_are_rounded(self):
+        """Teste, dass Profilwerte bereits gerundet im Dict stehen (Scores 1, Mittelwerte 2 Stellen)."""
+        ratings = {code: (i % 5) + 1 for i, code in enumerate(scoring.ITEM_DEFINITIONS)}
+        ratings["A1"] = 4  # ergibt nicht-triviale Nachkommastellen
+        profile = scoring.compute_profile(ratings)
+        
+        for dim in profile["dimensions"].values():
+            self.assertEqual(dim["score"], round(dim["score"], 1))
+            self.assertEqual(dim["raw_mean"], round(dim["raw_mean"], 2))
+        quality = profile["response_quality"]
+        self.assertEqual(quality["response_variance"], round(quality["response_variance"], 2))
+        self.assertEqual(quality["mean_response"], round(quality["mean_response"], 2))
+
+
+class TestTextReport(unittest.TestCase):
+    """Tests für generate_text_report."""
+    
+    def test_out_of_range_scores_give_clamped_bars(self):
+        """Teste, dass Scores außerhalb 0-100 einen leeren bzw. vollen Balken statt Fehler liefern."""
+        profile = scoring.compute_profile(dict.fromkeys(scoring.ITEM_DEFINITIONS, 3))
+        profile["dimensions"]["attention"]["score"] = -10.0
+        profile["dimensions"]["sensory"]["score"] = 150.0
+        
+        lines = scoring.generate_text_report(profile).splitlines()
+        bar_lengths = [line.count("█") for line in lines if "█" in line]
+        self.assertEqual(max(bar_lengths), 50)
+        self.assertNotIn(45, bar_lengths)  # kein Umlauf des negativen Index
+
+
+class TestVisualizeBatch(unittest.TestCase):
+    """Tests für den Batch-Modus von auswertung_visualize (serieller Pfad)."""
+    
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmp = Path(tmpdir.name)
+        # Serieller Pfad unabhängig von der CPU-Anzahl der Testmaschine
+        patcher = mock.patch.object(visualize.os, "cpu_count", return_value=1)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def _write_profile(self, name: str, ratings) -> Path:
+        path = self.tmp / f"{name}.json"
+        path.write_text(json.dumps(scoring.compute_profile(ratings, name)), encoding="utf-8")
+        return path
+    
+    def test_one_subfolder_per_profile(self):
+        """Teste, dass jedes Profil einen eigenen Unterordner output_dir/<stem>/ erhält."""
+        paths = [
+            self._write_profile("alice", {code: (i % 5) + 1 for i, code in enumerate(scoring.ITEM_DEFINITIONS)}),
+            self._write_profile("bob", dict.fromkeys(scoring.ITEM_DEFINITIONS, 3)),
+        ]
+        out = self.tmp / "charts"
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = visualize.visualize_profiles(paths, out)
+        
+        self.assertEqual(sorted(p.name for p in out.iterdir()), ["alice", "bob"])
+        for path, result in zip(paths, results):
+            self.assertEqual(result.parent, out / path.stem)
+            self.assertTrue((result / "report.html").exists())
+    
+    def test_invalid_profile_does_not_abort_batch(self):
+        """Teste, dass eine fehlerhafte JSON-Datei None liefert und die übrigen verarbeitet werden."""
+        broken = self.tmp / "session_index.json"
+        broken.write_text('{"sessions": []}', encoding="utf-8")
+        good = self._write_profile("carol", dict.fromkeys(scoring.ITEM_DEFINITIONS, 3))
+        
+        with contextlib.redirect_stdout(io.StringIO()), \
+                contextlib.redirect_stderr(io.StringIO()) as err:
+            results = visualize.visualize_profiles([broken, good], self.tmp / "charts")
+        
+        self.assertIsNone(results[0])
+        self.assertTrue((results[1] / "report.html").exists())
+        self.assertIn("session_index.json", err.getvalue())
+
+
+class TestVisualizeReport(unittest.TestCase):
+    """Tests für Radar-Chart-Sonderfälle und den HTML-Report von auswertung_visualize."""
+    
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmp = Path(tmpdir.name)
+    
+    def test_matplotlib_flag_is_bool_before_first_chart(self):
+        """Teste, dass MATPLOTLIB_AVAILABLE schon beim Import ein bool ist (ohne matplotlib zu laden)."""
+        import importlib.util
+        self.assertIsInstance(visualize.MATPLOTLIB_AVAILABLE, bool)
+        if importlib.util.find_spec("matplotlib") is not None:
+            self.assertTrue(visualize.MATPLOTLIB_AVAILABLE)
+    
+    def test_missing_chronotype_skips_matplotlib(self):
+        """Teste, dass ohne Chronotyp-Daten None zurückkommt, ohne matplotlib anzufassen."""
+        profile = scoring.compute_profile(dict.fromkeys(scoring.ITEM_DEFINITIONS, 3), "ohne")
+        del profile["additional_indices"]["chronotype"]
+        
+        with mock.patch.object(visualize, "_ensure_matplotlib") as ensure:
+            self.assertIsNone(visualize.create_chronotype_visualization(profile, self.tmp / "c.png"))
+        ensure.assert_not_called()
+        self.assertFalse((self.tmp / "c.png").exists())
+    
+    def test_flat_profile_skips_radar_chart(self):
+        """Teste, dass ein flaches Profil (alle Antworten 3) kein Radar-Chart, aber einen Hinweis erhält."""
+        profile = scoring.compute_profile(dict.fromkeys(scoring.ITEM_DEFINITIONS, 3), "flach")
+        radar_path = self.tmp / "radar_chart.png"
+        
+        self.assertIsNone(visualize.create_radar_chart(profile, radar_path))
+        self.assertFalse(radar_path.exists())
+        
+        report = self.tmp / "report.html"
+        visualize.generate_html_report(profile, report, self.tmp, chart_paths={"radar": None})
+        self.assertIn("alle Dimensionen haben denselben Score", report.read_text(encoding="utf-8"))
+
+    
+    def _profile_with_charts(self):
+        """Profil mit Chronotyp-Daten plus Platzhalter-Bilddateien (Inhalt wird nur kopiert/kodiert)."""
+        ratings = {code: (i % 5) + 1 for i, code in enumerate(scoring.ITEM_DEFINITIONS)}
+        profile = scoring.compute_profile(ratings, "bilder")
+        chart_paths = {}
+        for chart, filename in visualize._CHART_FILES.items():
+            path = self.tmp / filename
+            path.write_bytes(b"PNG-" + chart.encode())
+            chart_paths[chart] = path
+        return profile, chart_paths
+    
+    def test_images_embedded_as_data_uri_by_default(self):
+        """Teste, dass der Report die PNGs standardmäßig als base64-data:-URI enthält."""
+        profile, chart_paths = self._profile_with_charts()
+        report = self.tmp / "report.html"
+        visualize.generate_html_report(profile, report, self.tmp, chart_paths=chart_paths)
+        
+        html = report.read_text(encoding="utf-8")
+        self.assertIn('<img src="data:image/png;base64,' + base64.b64encode(b"PNG-radar").decode(), html)
+        self.assertEqual(html.count('src="data:image/png;base64,'), 3)
+        self.assertNotIn('src="radar_chart.png"', html)
+    
+    def test_embed_images_false_keeps_relative_links(self):
+        """Teste, dass embed_images=False die relativen Bild-Links wie bisher erzeugt."""
+        profile, chart_paths = self._profile_with_charts()
+        report = self.tmp / "report.html"
+        visualize.generate_html_report(profile, report, self.tmp, embed_images=False,
+                                       chart_paths=chart_paths)
+        
+        html = report.read_text(encoding="utf-8")
+        for filename in visualize._CHART_FILES.values():
+            self.assertIn(f'<img src="{filename}"', html)
+        self.assertNotIn("data:image/png", html)
+
+    
+    def test_chart_paths_decide_which_images_appear(self):
+        """Teste, dass mit chart_paths nur die übergebenen Bilder erscheinen (Dateien im img_dir egal)."""
+        profile, chart_paths = self._profile_with_charts()
+        chart_paths["bars"] = None  # liegt zwar im img_dir, wurde aber nicht (neu) erzeugt
+        report = self.tmp / "report.html"
+        visualize.generate_html_report(profile, report, self.tmp, embed_images=False,
+                                       chart_paths=chart_paths)
+        
+        html = report.read_text(encoding="utf-8")
+        self.assertIn('<img src="radar_chart.png"', html)
+        self.assertIn('<img src="chronotype.png"', html)
+        self.assertNotIn('<img src="dimension_bars.png"', html)
+        self.assertIn("Dimensionen-Balkendiagramm nicht verfügbar", html)
+    
+    def test_without_chart_paths_falls_back_to_img_dir(self):
+        """Teste, dass ohne chart_paths die Standard-Dateinamen im img_dir gesucht werden."""
+        profile, chart_paths = self._profile_with_charts()
+        chart_paths["bars"].unlink()
+        chart_paths["chronotype"].unlink()
+        report = self.tmp / "report.html"
+        visualize.generate_html_report(profile, report, self.tmp, embed_images=False)
+        
+        html = report.read_text(encoding="utf-8")
+        self.assertIn('<img src="radar_chart.png"', html)
+        self.assertIn("Dimensionen-Balkendiagramm nicht verfügbar", html)
+        self.assertIn("Chronotyp-Visualisierung nicht verfügbar", html)
+
+
+class TestOrchestratorInProcess(unittest.TestCase):
+    """Tests für LernprofilOrchestrator._run_in_process (Stages im laufenden Interpreter)."""
+    
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmp = Path(tmpdir.name)
+        config = orchestrator.WorkflowConfig(csv_path=self.tmp / "antworten.csv")
+        self.orch = orchestrator.LernprofilOrchestrator(config)
+    
+    def _run(self, func):
+        """Führt func als Stage aus; die Fortschrittsausgabe des Orchestrators wird verworfen."""
+        stdout, stderr = sys.stdout, sys.stderr
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = self.orch._run_in_process(func, [], "Test-Stage")
+        # Globale Streams müssen nach der Stage wiederhergestellt sein
+        self.assertIs(sys.stdout, stdout)
+        self.assertIs(sys.stderr, stderr)
+        return result
+    
+    def test_success_captures_output_and_path(self):
+        """Teste, dass Ausgaben mitgeschnitten und der Rückgabepfad als output_dir übernommen wird."""
+        def stage():
+            print("hallo stdout")
+            print("hallo stderr", file=sys.stderr)
+            return self.tmp
+        
+        result = self._run(stage)
+        self.assertTrue(result.success)
+        self.assertEqual(result.stage_name, "Test-Stage")
+        self.assertEqual(result.output_dir, self.tmp.resolve())
+        self.assertIsNone(result.error_message)
+        self.assertEqual(result.stdout, "hallo stdout\n")
+        self.assertEqual(result.stderr, "hallo stderr\n")
+    
+    def test_system_exit_nonzero_is_failure(self):
+        """Teste, dass SystemExit(1) als Fehler mit erster stderr-Zeile gemeldet wird."""
+        def stage():
+            print("❌ Datei fehlt\nDetails", file=sys.stderr)
+            sys.exit(1)
+        
+        result = self._run(stage)
+        self.assertFalse(result.success)
+        self.assertIsNone(result.output_dir)
+        self.assertEqual(result.error_message, "❌ Datei fehlt")
+        self.assertIn("Details", result.stderr)
+    
+    def test_exception_is_failure(self):
+        """Teste, dass eine Exception der Stage als Fehler statt als Absturz gemeldet wird."""
+        def stage():
+            print("vorher")
+            raise ValueError("kaputt")
+        
+        result = self._run(stage)
+        self.assertFalse(result.success)
+        self.assertEqual(result.error_message, "kaputt")
+        self.assertEqual(result.stdout, "vorher\n")
+        self.assertIsNone(result.output_dir)
+
+    def test_compute_output_stays_in_start_dir(self):
+        """Teste, dass auswertung/ im Startverzeichnis landet, auch wenn sich cwd danach ändert."""
+        lines = ["item_code,rating"] + [f"{code},3" for code in scoring.ITEM_DEFINITIONS]
+        csv_path = self.tmp / "antworten.csv"
+        csv_path.write_text("\n".join(lines), encoding="utf-8")
+        elsewhere = self.tmp / "woanders"
+        elsewhere.mkdir()
+
+        self.addCleanup(os.chdir, Path.cwd())
+        os.chdir(self.tmp)
+        orch = orchestrator.LernprofilOrchestrator(orchestrator.WorkflowConfig(csv_path=csv_path))
+        os.chdir(elsewhere)
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = orch._stage_compute()
+
+        self.assertTrue(result.success, result.error_message)
+        self.assertEqual(result.output_dir.parent, (self.tmp / "auswertung").resolve())
+        self.assertTrue((result.output_dir / "profil.json").exists())
+
+
+class TestOrchestratorSubprocess(unittest.TestCase):
+    """Tests für LernprofilOrchestrator._run_subprocess."""
+    
+    def test_crlf_output_is_normalized(self):
+        """Teste, dass Windows-Zeilenenden (CRLF) im mitgeschnittenen Output zu LF werden."""
+        config = orchestrator.WorkflowConfig(csv_path=Path("antworten.csv"))
+        orch = orchestrator.LernprofilOrchestrator(config)
+        cmd = [sys.executable, "-c",
+               "import sys; sys.stdout.buffer.write(b'Kopf\\r\\nTests durchgef\\xc3\\xbchrt: 3\\r\\n')"]
+        
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = orch._run_subprocess(cmd, "Test-Stage")
+        
+        self.assertTrue(result.success)
+        self.assertEqual(result.stdout, "Kopf\nTests durchgeführt: 3\n")
+        self.assertEqual(orch._TEST_SUMMARY_RE.findall(result.stdout), ["Tests durchgeführt: 3"])
 
 
 def run_tests():
@@ -310,13 +741,22 @@ def run_tests():
     
     # Alle Test-Klassen hinzufügen
     suite.addTests(loader.loadTestsFromTestCase(TestScoringBasics))
+    suite.addTests(loader.loadTestsFromTestCase(TestDimensionScorer))
     suite.addTests(loader.loadTestsFromTestCase(TestExtremProfiles))
     suite.addTests(loader.loadTestsFromTestCase(TestChronotype))
     suite.addTests(loader.loadTestsFromTestCase(TestResponseQuality))
     suite.addTests(loader.loadTestsFromTestCase(TestDimensionalIndependence))
     suite.addTests(loader.loadTestsFromTestCase(TestRatingValidation))
+    suite.addTests(loader.loadTestsFromTestCase(TestRatingsArray))
+    suite.addTests(loader.loadTestsFromTestCase(TestScoresBatch))
+    suite.addTests(loader.loadTestsFromTestCase(TestCsvLoading))
     suite.addTests(loader.loadTestsFromTestCase(TestItemCounts))
     suite.addTests(loader.loadTestsFromTestCase(TestMetadataConsistency))
+    suite.addTests(loader.loadTestsFromTestCase(TestTextReport))
+    suite.addTests(loader.loadTestsFromTestCase(TestVisualizeBatch))
+    suite.addTests(loader.loadTestsFromTestCase(TestVisualizeReport))
+    suite.addTests(loader.loadTestsFromTestCase(TestOrchestratorInProcess))
+    suite.addTests(loader.loadTestsFromTestCase(TestOrchestratorSubprocess))
     
     # Tests ausführen
     runner = unittest.TextTestRunner(verbosity=2)
@@ -14,6 +14,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 import auswertung as scoring
 import auswertung_visualize as visualize_profile
 
+# Neutrale Antworten (alle Items = 3), einmal aufgebaut; Varianten arbeiten auf Kopien
+NEUTRAL_RATINGS = dict.fromkeys(scoring.ITEM_DEFINITIONS, 3)
+
 print("=" * 80)
 print("FINALE VALIDIERUNG - VERSION 0.2.1")
 print("=" * 80)
@@ -28,8 +31,7 @@ assert scoring.VERSION == "0.2.1", "Version mismatch in scoring module"
 print("✅ scoring_v02.py: Version 0.2.1")
 
 # 1.2 Meta-Struktur
-ratings = {code: 3 for code in scoring.ITEM_DEFINITIONS.keys()}
-profile = scoring.compute_profile(ratings, "test")
+profile = scoring.compute_profile(NEUTRAL_RATINGS, "test")
 meta = profile['meta']
 
 assert meta['version'] == "0.2.1", "Profile version mismatch"
@@ -40,7 +42,8 @@ print("✅ Meta-Struktur: num_items_instrument + num_items_answered")
 
 # 1.3 Validierungs-Integration
 try:
-    ratings_invalid = {code: 3 for code in list(scoring.ITEM_DEFINITIONS.keys())[:-1]}
+    ratings_invalid = NEUTRAL_RATINGS.copy()
+    ratings_invalid.popitem()  # letztes Item entfernen
     scoring.validate_ratings(ratings_invalid)
     print("❌ validate_ratings sollte ValueError werfen")
     sys.exit(1)
@@ -50,7 +53,7 @@ except ValueError:
 # 1.4 Chronotyp-Fehlerbehandlung
 try:
     # Simuliere internen Fehler
-    ratings_broken = ratings.copy()
+    ratings_broken = NEUTRAL_RATINGS.copy()
     del ratings_broken['A8']
     scoring.compute_profile(ratings_broken)
     print("❌ Chronotyp sollte Fehler werfen")
@@ -71,11 +74,16 @@ print("-" * 80)
 with tempfile.TemporaryDirectory() as tmpdir:
     tmpdir = Path(tmpdir)
     
-    # Generiere HTML ohne Bilder
-    visualize_profile.generate_html_report(profile, tmpdir / 'report.html', tmpdir)
-    html = (tmpdir / 'report.html').read_text()
+    # Generiere HTML ohne Bilder (eingebettet und mit relativen Links):
+    # es darf kein <img>-Tag entstehen, stattdessen der Fallback-Text
+    fallback_ok = True
+    for embed in (True, False):
+        visualize_profile.generate_html_report(profile, tmpdir / 'report.html', tmpdir,
+                                               embed_images=embed)
+        html = (tmpdir / 'report.html').read_text(encoding='utf-8')
+        fallback_ok = fallback_ok and 'nicht verfügbar' in html and '<img' not in html
     
-    if 'nicht verfügbar' in html and '<img src="radar_chart.png"' not in html:
+    if fallback_ok:
         print("✅ HTML-Report: Fallback-Text bei fehlenden Bildern")
     else:
         print("❌ HTML-Report: Keine korrekte Behandlung fehlender Bilder")
@@ -110,11 +118,9 @@ assert len(scoring.DIMENSION_LABELS) == 6, "Dimensions != 6"
 print("✅ Dimensionen: 6")
 
 # Prüfe Item-Verteilung
-for code, label in scoring.DIMENSION_LABELS.items():
-    items = [i for i in scoring.ITEM_DEFINITIONS.values() 
-             if i.dimension_code == code and i.include_in_main_scale]
-    reverse = sum(1 for i in items if i.reverse_scored)
-    print(f"   - {code}: {len(items)} Items ({reverse} reverse)")
+for code in scoring.DIMENSION_LABELS:
+    print(f"   - {code}: {len(scoring.BY_DIMENSION[code])} Items "
+          f"({scoring.REVERSE_COUNT_BY_DIM[code]} reverse)")
 
 print()
 
@@ -132,7 +138,7 @@ assert 'meta' in profile, "Missing meta"
 print("✅ Profil-Keys: id, dimensions, additional_indices, response_quality, meta")
 
 # Prüfe Dimensionen
-for dim_code in scoring.DIMENSION_LABELS.keys():
+for dim_code in scoring.DIMENSION_LABELS:
     assert dim_code in profile['dimensions'], f"Missing dimension {dim_code}"
     dim = profile['dimensions'][dim_code]
     assert 'score' in dim, f"Missing score in {dim_code}"
@@ -177,8 +183,7 @@ assert scoring.classify_score(100) == "hoch", "Classify 100 failed"
 print("✅ Score-Kategorisierung: niedrig<40, mittel<75, hoch≥75")
 
 # Transformation
-ratings_neutral = {code: 3 for code in scoring.ITEM_DEFINITIONS.keys()}
-profile_neutral = scoring.compute_profile(ratings_neutral)
+profile_neutral = profile  # gleiche Antworten wie in 1.2 → Profil wiederverwenden
 for dim_code, dim in profile_neutral['dimensions'].items():
     # Likert 3 sollte etwa Score 50 ergeben
     assert 45 <= dim['score'] <= 55, f"Neutral score {dim_code} not around 50"
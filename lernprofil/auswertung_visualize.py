@@ -20,6 +20,7 @@ Erzeugt automatisch:
 2. Balkendiagramm der Dimensionen (mit farblicher Niveau-Kodierung)
 3. Chronotyp-Visualisierung
 4. Kompakten HTML-Report mit allen Grafiken und wichtigsten Werten
+   (Grafiken als data:-URI eingebettet → eine eigenständige, teilbare Datei)
 
 EINGABEN
 ========
@@ -32,130 +33,274 @@ AUSGABEN
 
 TECHNISCHE HINWEISE
 ===================
-- Abhängigkeiten: matplotlib, numpy
-- Verwendet ein nicht-interaktives Backend (Agg), um Grafiken ohne GUI zu erzeugen.
-- Das Script prüft robust, ob matplotlib verfügbar ist.
+- Abhängigkeiten: matplotlib, numpy (optional: orjson für schnelleres Einlesen)
+- Zeichnet direkt auf Figure + FigureCanvasAgg (nicht-interaktiv, ohne pyplot-Zustand),
+  um Grafiken ohne GUI zu erzeugen.
+- Das Script prüft robust, ob matplotlib verfügbar ist: MATPLOTLIB_AVAILABLE ist
+  schon beim Import gesetzt (nur Modulsuche), matplotlib/numpy selbst werden erst
+  beim ersten Diagramm importiert; der reine HTML-Report braucht sie nicht.
+- Balken- und Chronotyp-Grafik werden über Pillow (kommt mit matplotlib) als
+  8-bit-Paletten-PNG gespeichert; das Radar-Chart bleibt RGBA (halbtransparente Fläche).
 
 AUFRUF
 ======
     python lernprofil/auswertung_visualize.py profil.json --output charts
+    python lernprofil/auswertung_visualize.py profile/ --output charts   # Batch
+    python lernprofil/auswertung_visualize.py profil.json --no-embed     # Bilder nur verlinken
 
 Wenn kein --output angegeben wird, wird automatisch der Ordner "charts" erzeugt.
+Bei einem Verzeichnis werden alle *.json-Profile darin parallel verarbeitet
+(je Profil ein Unterordner charts/<dateiname>/TIMESTAMP/).
 
 """
 
 from __future__ import annotations
 
 import argparse
+import base64
+import importlib.util
+import io
 import json
+import multiprocessing
+import os
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import sys
 from datetime import datetime
 
 try:
-    import matplotlib
-    matplotlib.use('Agg')  # Non-interactive backend
-    import matplotlib.pyplot as plt
-    import numpy as np
-    from matplotlib.patches import Rectangle
-    MATPLOTLIB_AVAILABLE = True
+    import orjson  # Optional: parst die Profil-JSON direkt aus Bytes
+    ORJSON_AVAILABLE = True
 except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    print("⚠️  matplotlib nicht verfügbar. Installieren mit: pip install matplotlib", 
-          file=sys.stderr)
+    ORJSON_AVAILABLE = False
 
+# Verfügbarkeit wird beim Import nur anhand der Modulsuche geprüft (ohne matplotlib zu laden);
+# der eigentliche Import von matplotlib/numpy folgt beim ersten Diagramm (siehe _ensure_matplotlib)
+MATPLOTLIB_AVAILABLE: bool = (importlib.util.find_spec("matplotlib") is not None
+                              and importlib.util.find_spec("numpy") is not None)
+_MATPLOTLIB_LOADED: Optional[bool] = None  # None = Import noch nicht versucht
 
-def create_radar_chart(profile: Dict[str, Any], output_path: Path) -> None:
+# Feste Reihenfolge der 6 Hauptdimensionen in allen Grafiken und im Report
+_DIM_ORDER: Tuple[str, ...] = ("attention", "sensory", "social", "executive", "motivation", "regulation")
+
+# Kategorie-Grenzen niedrig/mittel und mittel/hoch (Score 0-100)
+_THRESHOLDS: Tuple[int, int] = (40, 75)
+_RADAR_RGRIDS: Tuple[int, ...] = (25, 40, 50, 75, 100)  # enthält beide Grenzen als Ringe
+
+# Kategorie-Farben: Index je Niveau; RGBA-Tabelle entsteht beim matplotlib-Import
+_LEVEL_IDX = {"niedrig": 0, "mittel": 1, "hoch": 2}
+_LEVEL_COLORS = ("#E63946", "#F4A261", "#2A9D8F")
+_SCORE_CLASS = {level: f"score-{level}" for level in _LEVEL_IDX}
+
+# Dateinamen der Grafiken im Ausgabeordner (Schlüssel wie in chart_paths)
+_CHART_FILES = {"radar": "radar_chart.png", "bars": "dimension_bars.png", "chronotype": "chronotype.png"}
+
+_PROFILE_COLOR = "#2E86AB"
+_CHRONO_COLORS = ("#F4D03F", "#5DADE2")  # Morgen, Abend
+
+
+def _ensure_matplotlib() -> bool:
     """
-    Erstellt ein Radar-Chart für die 6 Hauptdimensionen.
+    Importiert matplotlib und numpy beim ersten Aufruf und legt sie als Modul-Globals ab.
+    Gibt zurück, ob matplotlib verfügbar ist (scheitert der Import, wird
+    MATPLOTLIB_AVAILABLE auf False korrigiert).
     """
+    global MATPLOTLIB_AVAILABLE, _MATPLOTLIB_LOADED
+    global Figure, FigureCanvasAgg, np, Rectangle, Line2D, Image, rc_context, _LEVEL_RGBA
+    if _MATPLOTLIB_LOADED is not None:
+        return _MATPLOTLIB_LOADED
+    if MATPLOTLIB_AVAILABLE:
+        try:
+            from matplotlib import rc_context
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg  # Non-interactive backend
+            import numpy as np
+            from matplotlib.patches import Rectangle
+            from matplotlib.lines import Line2D
+            from matplotlib.colors import to_rgba
+            _LEVEL_RGBA = np.array([to_rgba(c) for c in _LEVEL_COLORS])
+        except ImportError:
+            MATPLOTLIB_AVAILABLE = False
     if not MATPLOTLIB_AVAILABLE:
+        print("⚠️  matplotlib nicht verfügbar. Installieren mit: pip install matplotlib", 
+              file=sys.stderr)
+        _MATPLOTLIB_LOADED = False
+        return False
+    # Pillow nur für die Paletten-PNGs; fehlt es, wird normal gespeichert
+    try:
+        from PIL import Image
+    except ImportError:
+        Image = None
+    _MATPLOTLIB_LOADED = True
+    return True
+
+
+# PNG-Ausgabe: 150 dpi reichen für die Einbettung im HTML-Report (max-width: 100%);
+# schwache zlib-Kompression spart Rechenzeit beim Speichern
+PNG_DPI = 150
+_PNG_PIL_KWARGS = {"compress_level": 1}
+
+# Rand um den Figure-Inhalt (Zoll); die langen Radar-Achsenbeschriftungen
+# stoßen mit dem Standardwert fast an den Bildrand
+_LAYOUT_PADS = {"figure.constrained_layout.w_pad": 0.15,
+                "figure.constrained_layout.h_pad": 0.1}
+
+# Gemeinsame Figure für alle Diagramme: wird pro Chart geleert statt neu erzeugt.
+# Sie ist nicht bei pyplot registriert (kein globaler Figure-Manager, prozesssicher).
+_FIG = None
+
+
+def _get_figure(figsize):
+    """
+    Liefert die gemeinsame Figure, geleert und auf die gewünschte Größe gesetzt.
+    """
+    global _FIG
+    if _FIG is None:
+        # constrained layout: Abstände werden beim Speichern mitberechnet (kein tight_layout-Durchlauf);
+        # die Ränder werden beim Anlegen aus den rcParams übernommen
+        with rc_context(_LAYOUT_PADS):
+            _FIG = Figure(figsize=figsize, layout="constrained")
+        FigureCanvasAgg(_FIG)
+    else:
+        _FIG.clear()
+        _FIG.set_size_inches(figsize)
+    return _FIG
+
+
+def _close_figure() -> None:
+    """
+    Gibt die gemeinsame Figure frei (nach dem letzten Chart).
+    """
+    global _FIG
+    _FIG = None
+
+
+# Flächige Diagramme (Balken, Chronotyp) haben nur wenige Farben → 8-bit-Palette
+_PALETTE_COLORS = 64
+
+
+def _save_quantized(fig, output_path: Path) -> None:
+    """
+    Speichert die Figure als palettiertes PNG (nicht für Verläufe/Transparenz geeignet).
+    Ohne Pillow wird ein normales RGBA-PNG geschrieben.
+    """
+    if Image is None:
+        fig.savefig(output_path, dpi=PNG_DPI, pil_kwargs=_PNG_PIL_KWARGS)
         return
-    
+    buf = io.BytesIO()
+    # Zwischenbild unkomprimiert; komprimiert wird erst die Palettenversion
+    fig.savefig(buf, format="png", dpi=PNG_DPI, pil_kwargs={"compress_level": 0})
+    buf.seek(0)
+    with Image.open(buf) as img:
+        # Image.Quantize gibt es erst ab Pillow 9.1; ältere Versionen haben nur die Konstante
+        mediancut = getattr(Image, "Quantize", Image).MEDIANCUT
+        paletted = img.convert("RGB").quantize(colors=_PALETTE_COLORS, method=mediancut)
+    paletted.save(output_path, format="PNG", **_PNG_PIL_KWARGS)
+
+
+def _is_flat_profile(dimensions: Dict[str, Any]) -> bool:
+    """
+    True, wenn alle 6 Dimensionen denselben Score haben (inkl. alle 0).
+    Das Radar-Chart wäre dann nur ein regelmäßiges Sechseck ohne Aussagekraft.
+    """
+    scores = [dimensions[dim]["score"] for dim in _DIM_ORDER]
+    return max(scores) - min(scores) < 1e-6
+
+
+def create_radar_chart(profile: Dict[str, Any], output_path: Path) -> Optional[Path]:
+    """
+    Erstellt ein Radar-Chart für die 6 Hauptdimensionen.
+    Gibt den Pfad des geschriebenen Bildes zurück (None bei flachem Profil).
+    """
     dimensions = profile["dimensions"]
-    dim_order = ["attention", "sensory", "social", "executive", "motivation", "regulation"]
+    if _is_flat_profile(dimensions):
+        return None
+    if not _ensure_matplotlib():
+        return None
     
-    # Daten extrahieren
-    labels = [dimensions[dim]["label"] for dim in dim_order]
-    scores = [dimensions[dim]["score"] for dim in dim_order]
+    # Daten extrahieren (Scores direkt als ndarray)
+    num_dims = len(_DIM_ORDER)
+    labels = [dimensions[dim]["label"] for dim in _DIM_ORDER]
+    scores = np.fromiter((dimensions[dim]["score"] for dim in _DIM_ORDER),
+                         dtype=np.float64, count=num_dims)
     
-    # Anzahl der Dimensionen
-    num_dims = len(labels)
-    angles = np.linspace(0, 2 * np.pi, num_dims, endpoint=False).tolist()
-    scores_plot = scores + [scores[0]]  # Schließe den Plot
-    angles_plot = angles + [angles[0]]
+    angles = np.linspace(0, 2 * np.pi, num_dims, endpoint=False)
+    scores_plot = np.concatenate((scores, scores[:1]))  # Schließe den Plot
+    angles_plot = np.concatenate((angles, angles[:1]))
     
     # Plot erstellen
-    fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
+    fig = _get_figure((11, 9))  # breiter als hoch: Platz für die Legende rechts neben der Polar-Achse
+    ax = fig.add_subplot(111, projection='polar')
     
     # Radar-Chart zeichnen
-    ax.plot(angles_plot, scores_plot, 'o-', linewidth=2, color='#2E86AB', label='Ihr Profil')
-    ax.fill(angles_plot, scores_plot, alpha=0.25, color='#2E86AB')
-    
-    # Referenzlinien (niedrig/mittel/hoch Bereiche)
-    ax.plot(angles_plot, [40] * len(angles_plot), '--', linewidth=0.8, 
-            color='gray', alpha=0.5, label='Grenze niedrig/mittel')
-    ax.plot(angles_plot, [75] * len(angles_plot), '--', linewidth=0.8, 
-            color='gray', alpha=0.5, label='Grenze mittel/hoch')
+    ax.plot(angles_plot, scores_plot, 'o-', linewidth=2, color=_PROFILE_COLOR, label='Ihr Profil')
+    ax.fill(angles_plot, scores_plot, alpha=0.25, color=_PROFILE_COLOR)
     
     # Achsenbeschriftung
     ax.set_xticks(angles)
     ax.set_xticklabels(labels, size=10)
     ax.set_ylim(0, 100)
-    ax.set_yticks([25, 50, 75, 100])
-    ax.set_yticklabels(['25', '50', '75', '100'], size=8)
+    # Grenzen niedrig/mittel und mittel/hoch als radiale Gitterringe
+    # statt eigener gestrichelter Polylinien
+    ax.set_rgrids(_RADAR_RGRIDS, size=8)
     ax.grid(True, linewidth=0.5, alpha=0.3)
+    threshold_style = dict(linestyle='--', linewidth=0.8, color='gray', alpha=0.5)
+    gridlines = ax.yaxis.get_gridlines()
+    for threshold in _THRESHOLDS:
+        gridlines[_RADAR_RGRIDS.index(threshold)].set(**threshold_style)
     
     # Titel und Legende
-    plt.title(f"Lernenergie-Profil: {profile['id']}\nVersion {profile['meta']['version']}", 
-              size=14, pad=20)
-    plt.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1))
+    ax.set_title(f"Lernenergie-Profil: {profile['id']}\nVersion {profile['meta']['version']}", 
+                 size=14, pad=20)
+    # Gitterringe haben keinen Legendeneintrag → Platzhalter-Linien im selben Stil
+    handles, _ = ax.get_legend_handles_labels()
+    handles += [
+        Line2D([], [], label=f'Grenze niedrig/mittel ({_THRESHOLDS[0]})', **threshold_style),
+        Line2D([], [], label=f'Grenze mittel/hoch ({_THRESHOLDS[1]})', **threshold_style),
+    ]
+    # Legende rechts neben der Achse; constrained layout reserviert den Platz dafür
+    ax.legend(handles=handles, loc='upper left', bbox_to_anchor=(1.05, 1))
     
     # Speichern
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=PNG_DPI, pil_kwargs=_PNG_PIL_KWARGS)
+    return output_path
 
 
-def create_dimension_bars(profile: Dict[str, Any], output_path: Path) -> None:
+def create_dimension_bars(profile: Dict[str, Any], output_path: Path) -> Optional[Path]:
     """
     Erstellt Balkendiagramme für alle Dimensionen mit Kategorie-Färbung.
+    Gibt den Pfad des geschriebenen Bildes zurück, sonst None.
     """
-    if not MATPLOTLIB_AVAILABLE:
-        return
+    if not _ensure_matplotlib():
+        return None
     
     dimensions = profile["dimensions"]
-    dim_order = ["attention", "sensory", "social", "executive", "motivation", "regulation"]
-    
     # Daten extrahieren
-    labels = [dimensions[dim]["label"] for dim in dim_order]
-    scores = [dimensions[dim]["score"] for dim in dim_order]
-    levels = [dimensions[dim]["level"] for dim in dim_order]
-    
-    # Farben für Kategorien
-    color_map = {
-        "niedrig": "#E63946",
-        "mittel": "#F4A261",
-        "hoch": "#2A9D8F"
-    }
-    colors = [color_map[level] for level in levels]
+    labels = [dimensions[dim]["label"] for dim in _DIM_ORDER]
+    scores = np.fromiter((dimensions[dim]["score"] for dim in _DIM_ORDER),
+                         dtype=np.float64, count=len(_DIM_ORDER))
+    levels = [dimensions[dim]["level"] for dim in _DIM_ORDER]
+    
+    # Farben für Kategorien (RGBA-Zeilen per Index, kein Hex-Parsing pro Aufruf)
+    level_idx = np.fromiter((_LEVEL_IDX[level] for level in levels),
+                            dtype=np.intp, count=len(levels))
+    colors = _LEVEL_RGBA[level_idx]
     
     # Plot erstellen
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig = _get_figure((12, 6))
+    ax = fig.add_subplot(111)
     
     # Balken zeichnen
     y_pos = np.arange(len(labels))
     bars = ax.barh(y_pos, scores, color=colors, alpha=0.8, edgecolor='black', linewidth=0.5)
     
     # Referenzlinien für Kategoriegrenzen
-    ax.axvline(x=40, color='gray', linestyle='--', linewidth=1, alpha=0.5)
-    ax.axvline(x=75, color='gray', linestyle='--', linewidth=1, alpha=0.5)
+    for threshold in _THRESHOLDS:
+        ax.axvline(x=threshold, color='gray', linestyle='--', linewidth=1, alpha=0.5)
     
-    # Beschriftung der Balken mit Scores
-    for i, (bar, score, level) in enumerate(zip(bars, scores, levels)):
-        ax.text(score + 2, i, f"{score:.1f} ({level})", 
-                va='center', fontsize=9, fontweight='bold')
+    # Beschriftung der Balken mit Scores (ein bar_label-Aufruf statt Text je Balken)
+    ax.bar_label(bars, labels=[f"{score:.1f} ({level})" for score, level in zip(scores, levels)],
+                 padding=10, fontsize=9, fontweight='bold')
     
     # Achsen
     ax.set_yticks(y_pos)
@@ -167,52 +312,49 @@ def create_dimension_bars(profile: Dict[str, Any], output_path: Path) -> None:
     
     # Legende für Kategorien
     legend_elements = [
-        Rectangle((0, 0), 1, 1, fc=color_map["niedrig"], alpha=0.8, label="Niedrig (0-39)"),
-        Rectangle((0, 0), 1, 1, fc=color_map["mittel"], alpha=0.8, label="Mittel (40-74)"),
-        Rectangle((0, 0), 1, 1, fc=color_map["hoch"], alpha=0.8, label="Hoch (75-100)")
+        Rectangle((0, 0), 1, 1, fc=_LEVEL_RGBA[_LEVEL_IDX["niedrig"]], alpha=0.8, label="Niedrig (0-39)"),
+        Rectangle((0, 0), 1, 1, fc=_LEVEL_RGBA[_LEVEL_IDX["mittel"]], alpha=0.8, label="Mittel (40-74)"),
+        Rectangle((0, 0), 1, 1, fc=_LEVEL_RGBA[_LEVEL_IDX["hoch"]], alpha=0.8, label="Hoch (75-100)")
     ]
     ax.legend(handles=legend_elements, loc='lower right', fontsize=9)
     
     # Speichern
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    _save_quantized(fig, output_path)
+    return output_path
 
 
-def create_chronotype_visualization(profile: Dict[str, Any], output_path: Path) -> None:
+def create_chronotype_visualization(profile: Dict[str, Any], output_path: Path) -> Optional[Path]:
     """
     Erstellt eine Visualisierung des Chronotyp-Profils.
+    Gibt den Pfad des geschriebenen Bildes zurück (None ohne Chronotyp-Daten).
     """
-    if not MATPLOTLIB_AVAILABLE:
-        return
-    
-    chronotype = profile.get("additional_indices", {}).get("chronotype")
+    # Ohne Chronotyp-Daten gar nicht erst matplotlib laden
+    chronotype = (profile.get("additional_indices") or {}).get("chronotype")
     if not chronotype:
-        return
+        return None
+    if not _ensure_matplotlib():
+        return None
     
     morning = chronotype["morning_tendency"]
     evening = chronotype["evening_tendency"]
     interpretation = chronotype["interpretation"]
     
     # Plot erstellen
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig = _get_figure((10, 5))
+    ax = fig.add_subplot(111)
     
     # Balken für Morgen- und Abendtendenz
     categories = ["Morgentendenz", "Abendtendenz"]
     scores = [morning, evening]
-    colors = ["#F4D03F", "#5DADE2"]
     
-    bars = ax.bar(categories, scores, color=colors, alpha=0.8, edgecolor='black', linewidth=1)
+    bars = ax.bar(categories, scores, color=_CHRONO_COLORS, alpha=0.8, edgecolor='black', linewidth=1)
     
     # Referenzlinien
     ax.axhline(y=50, color='gray', linestyle='--', linewidth=1, alpha=0.5, label='Neutral (50)')
     
     # Beschriftung
-    for bar, score in zip(bars, scores):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 2,
-                f'{score:.1f}',
-                ha='center', va='bottom', fontweight='bold', fontsize=11)
+    ax.bar_label(bars, labels=[f'{score:.1f}' for score in scores],
+                 padding=5, fontweight='bold', fontsize=11)
     
     # Achsen und Titel
     ax.set_ylabel('Tendenz-Score (0-100)', fontsize=11)
@@ -234,117 +376,194 @@ def create_chronotype_visualization(profile: Dict[str, Any], output_path: Path)
             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.3))
     
     # Speichern
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    _save_quantized(fig, output_path)
+    return output_path
 
 
-def generate_html_report(profile: Dict[str, Any], output_path: Path, 
-                        img_dir: Path) -> None:
-    """
-    Generiert einen vollständigen HTML-Report mit eingebetteten Visualisierungen.
-    Prüft Existenz der Bild-Dateien und passt HTML entsprechend an.
-    """
-    # Prüfe verfügbare Visualisierungen
-    has_radar = (img_dir / "radar_chart.png").exists()
-    has_bars = (img_dir / "dimension_bars.png").exists()
-    has_chronotype = (img_dir / "chronotype.png").exists()
-    
-    html = f"""<!DOCTYPE html>
+# ---------------------------------------------------------------------------
+# HTML-Bausteine (statisch, einmal beim Import erzeugt)
+# ---------------------------------------------------------------------------
+
+_HTML_DOC_START = """<!DOCTYPE html>
 <html lang="de">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Lernenergie-Profil: {profile['id']}</title>
-    <style>
-        body {{
+    <title>Lernenergie-Profil: {pid}</title>
+"""
+
+_HTML_STYLE = """    <style>
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             max-width: 1200px;
             margin: 0 auto;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 30px;
             border-radius: 10px;
             margin-bottom: 30px;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             margin: 0 0 10px 0;
-        }}
-        .section {{
+        }
+        .section {
             background: white;
             padding: 25px;
             margin-bottom: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .quality-warning {{
+        }
+        .quality-warning {
             background-color: #fff3cd;
             border-left: 4px solid #ffc107;
             padding: 15px;
             margin-bottom: 20px;
             border-radius: 4px;
-        }}
-        .quality-ok {{
+        }
+        .quality-ok {
             background-color: #d4edda;
             border-left: 4px solid #28a745;
             padding: 15px;
             margin-bottom: 20px;
             border-radius: 4px;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 15px;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 12px;
             text-align: left;
             border-bottom: 1px solid #ddd;
-        }}
-        th {{
+        }
+        th {
             background-color: #f8f9fa;
             font-weight: 600;
-        }}
-        .score-niedrig {{ color: #E63946; font-weight: bold; }}
-        .score-mittel {{ color: #F4A261; font-weight: bold; }}
-        .score-hoch {{ color: #2A9D8F; font-weight: bold; }}
-        img {{
+        }
+        .score-niedrig { color: #E63946; font-weight: bold; }
+        .score-mittel { color: #F4A261; font-weight: bold; }
+        .score-hoch { color: #2A9D8F; font-weight: bold; }
+        img {
             max-width: 100%;
             height: auto;
             display: block;
             margin: 20px auto;
-        }}
-        .next-steps {{
+        }
+        .next-steps {
             background-color: #e7f3ff;
             border-left: 4px solid #2196F3;
             padding: 15px;
             margin-top: 20px;
             border-radius: 4px;
-        }}
-        .next-steps ol {{
+        }
+        .next-steps ol {
             margin: 10px 0 0 20px;
             padding: 0;
-        }}
-        .next-steps li {{
+        }
+        .next-steps li {
             margin: 8px 0;
-        }}
+        }
     </style>
 </head>
 <body>
-    <div class="header">
+"""
+
+_HTML_HEADER = """    <div class="header">
         <h1>Lernenergie-Profil</h1>
-        <p>Profil-ID: {profile['id']} | Version: {profile['meta']['version']}</p>
+        <p>Profil-ID: {pid} | Version: {ver}</p>
     </div>
 """
+
+_HTML_FOOTER = """
+    <div class="section">
+        <h2>Nächste Schritte</h2>
+        <div class="next-steps">
+            <ol>
+                <li>Dieses Profil mit einer datenschutzkonformen KI analysieren lassen 
+                    (z.B. Academic Cloud oder KI-Assist der FU Berlin)</li>
+                <li>Konkrete Lernstrategien auf Basis Ihres Profils entwickeln</li>
+                <li>Profil bei Bedarf mit Lehrenden oder Lerncoaches besprechen</li>
+                <li>Nach einigen Wochen den Fragebogen wiederholen, um Entwicklungen zu erfassen</li>
+            </ol>
+        </div>
+    </div>
+    
+    <div class="section">
+        <h2>Wichtige Hinweise</h2>
+        <p>Dieses Profil ist ein Prototyp zur strukturierten Selbstreflexion. 
+        Es ersetzt keine professionelle Beratung oder Diagnostik.</p>
+        <p><strong>Datenschutz:</strong> Dieses Profil wurde lokal auf Ihrem Computer erstellt. 
+        Sie entscheiden selbst, ob und mit wem Sie es teilen.</p>
+    </div>
+</body>
+</html>
+"""
+
+
+def _image_src(image_path: Path, embed: bool) -> str:
+    """
+    Bildquelle für den HTML-Report: base64-data:-URI oder relativer Dateiname.
+    """
+    if embed:
+        return "data:image/png;base64," + base64.b64encode(image_path.read_bytes()).decode("ascii")
+    return image_path.name
+
+
+def _dimension_row(dim: Dict[str, Any]) -> str:
+    """
+    Eine Tabellenzeile der Dimensionen-Tabelle.
+    """
+    score_class = _SCORE_CLASS[dim['level']]
+    return f"""
+                <tr>
+                    <td>{dim['label']}</td>
+                    <td class="{score_class}">{dim['score']:.1f}</td>
+                    <td class="{score_class}">{dim['level'].upper()}</td>
+                    <td>{dim['num_items']}</td>
+                    <td>{dim['num_reversed']}</td>
+                </tr>
+"""
+
+
+def generate_html_report(profile: Dict[str, Any], output_path: Path, 
+                        img_dir: Path, embed_images: bool = True,
+                        chart_paths: Optional[Dict[str, Optional[Path]]] = None) -> None:
+    """
+    Generiert einen vollständigen HTML-Report mit eingebetteten Visualisierungen.
+    Passt das HTML an die verfügbaren Bild-Dateien an.
+    
+    Mit embed_images=True (Standard) werden die PNGs als data:-URI eingebettet,
+    sodass report.html ohne die Bild-Dateien weitergegeben werden kann.
+    chart_paths ({"radar", "bars", "chronotype"} → Path oder None) sind die Rückgaben
+    der create_*-Funktionen; ohne chart_paths werden die Dateien im img_dir gesucht.
+    """
+    # Verfügbare Visualisierungen
+    if chart_paths is None:
+        chart_paths = {}
+        for chart, filename in _CHART_FILES.items():
+            path = img_dir / filename
+            chart_paths[chart] = path if path.exists() else None
+    radar_path = chart_paths.get("radar")
+    bars_path = chart_paths.get("bars")
+    chronotype_path = chart_paths.get("chronotype")
+    
+    dimensions = profile["dimensions"]
+    
+    # Teile sammeln und einmal zusammenfügen statt wiederholter String-Konkatenation
+    parts: List[str] = []
+    parts.append(_HTML_DOC_START.format(pid=profile['id']))
+    parts.append(_HTML_STYLE)
+    parts.append(_HTML_HEADER.format(pid=profile['id'], ver=profile['meta']['version']))
     
     # Response Quality
     quality = profile.get("response_quality", {})
     quality_class = "quality-warning" if quality.get("quality_flag") == "check" else "quality-ok"
-    html += f"""
+    parts.append(f"""
     <div class="section">
         <h2>Antwortqualität</h2>
         <div class="{quality_class}">
@@ -352,39 +571,41 @@ def generate_html_report(profile: Dict[str, Any], output_path: Path,
             <strong>Verschiedene Antworten:</strong> {quality.get('num_unique_responses', 'N/A')}<br>
             <strong>Antwortvariation:</strong> {quality.get('response_variance', 'N/A')}<br>
             <strong>Durchschnitt:</strong> {quality.get('mean_response', 'N/A')}
-"""
+""")
     if quality.get('warnings'):
-        html += f"<br><br><strong>⚠️ Warnungen:</strong><br>{'<br>'.join(quality['warnings'])}"
-    html += """
+        parts.append(f"<br><br><strong>⚠️ Warnungen:</strong><br>{'<br>'.join(quality['warnings'])}")
+    parts.append("""
         </div>
     </div>
-"""
+""")
     
     # Visualisierungen
-    html += """
+    parts.append("""
     <div class="section">
         <h2>Profil-Übersicht</h2>
-"""
-    
-    if has_radar:
-        html += '        <img src="radar_chart.png" alt="Radar-Chart">\n'
+""")
+    
+    if radar_path:
+        src = _image_src(radar_path, embed_images)
+        parts.append(f'        <img src="{src}" alt="Radar-Chart">\n')
+    elif _is_flat_profile(dimensions):
+        parts.append('        <p><em>Radar-Chart nicht verfügbar: alle Dimensionen haben denselben Score '
+                     '(siehe Antwortqualität).</em></p>\n')
     else:
-        html += '        <p><em>Radar-Chart nicht verfügbar (matplotlib nicht installiert oder Fehler bei Generierung).</em></p>\n'
+        parts.append('        <p><em>Radar-Chart nicht verfügbar (matplotlib nicht installiert oder Fehler bei Generierung).</em></p>\n')
     
-    if has_bars:
-        html += '        <img src="dimension_bars.png" alt="Dimensionen-Balken">\n'
+    if bars_path:
+        src = _image_src(bars_path, embed_images)
+        parts.append(f'        <img src="{src}" alt="Dimensionen-Balken">\n')
     else:
-        html += '        <p><em>Dimensionen-Balkendiagramm nicht verfügbar (matplotlib nicht installiert oder Fehler bei Generierung).</em></p>\n'
+        parts.append('        <p><em>Dimensionen-Balkendiagramm nicht verfügbar (matplotlib nicht installiert oder Fehler bei Generierung).</em></p>\n')
     
-    html += """
+    parts.append("""
     </div>
-"""
+""")
     
     # Dimensionen-Tabelle
-    dimensions = profile["dimensions"]
-    dim_order = ["attention", "sensory", "social", "executive", "motivation", "regulation"]
-    
-    html += """
+    parts.append("""
     <div class="section">
         <h2>Dimensionen im Detail</h2>
         <table>
@@ -398,94 +619,66 @@ def generate_html_report(profile: Dict[str, Any], output_path: Path,
                 </tr>
             </thead>
             <tbody>
-"""
+""")
     
-    for dim_code in dim_order:
-        dim = dimensions[dim_code]
-        score_class = f"score-{dim['level']}"
-        html += f"""
-                <tr>
-                    <td>{dim['label']}</td>
-                    <td class="{score_class}">{dim['score']:.1f}</td>
-                    <td class="{score_class}">{dim['level'].upper()}</td>
-                    <td>{dim['num_items']}</td>
-                    <td>{dim['num_reversed']}</td>
-                </tr>
-"""
+    parts.append("".join(_dimension_row(dimensions[dim_code]) for dim_code in _DIM_ORDER))
     
-    html += """
+    parts.append("""
             </tbody>
         </table>
     </div>
-"""
+""")
+    
+    # Zusatzindizes (fehlen bei minimalen Profilen → Abschnitte entfallen)
+    add_idx = profile.get("additional_indices") or {}
     
     # Chronotyp
-    if "chronotype" in profile.get("additional_indices", {}):
-        chronotype = profile["additional_indices"]["chronotype"]
-        html += f"""
+    chronotype = add_idx.get("chronotype")
+    if chronotype:
+        parts.append(f"""
     <div class="section">
         <h2>Chronotyp-Profil</h2>
-"""
-        if has_chronotype:
-            html += f'        <img src="chronotype.png" alt="Chronotyp">\n'
+""")
+        if chronotype_path:
+            src = _image_src(chronotype_path, embed_images)
+            parts.append(f'        <img src="{src}" alt="Chronotyp">\n')
         else:
-            html += '        <p><em>Chronotyp-Visualisierung nicht verfügbar (matplotlib nicht installiert oder Fehler bei Generierung).</em></p>\n'
+            parts.append('        <p><em>Chronotyp-Visualisierung nicht verfügbar (matplotlib nicht installiert oder Fehler bei Generierung).</em></p>\n')
         
-        html += f"""        <p><strong>Interpretation:</strong> {chronotype['interpretation']}</p>
+        parts.append(f"""        <p><strong>Interpretation:</strong> {chronotype['interpretation']}</p>
         <p><strong>Morgentendenz:</strong> {chronotype['morning_tendency']:.1f}</p>
         <p><strong>Abendtendenz:</strong> {chronotype['evening_tendency']:.1f}</p>
         <p><strong>Balance-Score:</strong> {chronotype['balance_score']:.2f}</p>
     </div>
-"""
+""")
     
     # Vermeidungsorientierung
-    if "motivation_avoidance" in profile.get("additional_indices", {}):
-        avoid = profile["additional_indices"]["motivation_avoidance"]
-        score_class = f"score-{avoid['level']}"
-        html += f"""
+    avoid = add_idx.get("motivation_avoidance")
+    if avoid:
+        score_class = _SCORE_CLASS[avoid['level']]
+        parts.append(f"""
     <div class="section">
         <h2>Vermeidungsorientierung</h2>
         <p><strong>Score:</strong> <span class="{score_class}">{avoid['score']:.1f} ({avoid['level'].upper()})</span></p>
         <p>Vermeidungsorientierung erfasst, inwieweit Sie durch das Vermeiden von Fehlern oder Misserfolgen motiviert sind.</p>
     </div>
-"""
+""")
     
-    # Nächste Schritte
-    html += """
-    <div class="section">
-        <h2>Nächste Schritte</h2>
-        <div class="next-steps">
-            <ol>
-                <li>Dieses Profil mit einer datenschutzkonformen KI analysieren lassen 
-                    (z.B. Academic Cloud oder KI-Assist der FU Berlin)</li>
-                <li>Konkrete Lernstrategien auf Basis Ihres Profils entwickeln</li>
-                <li>Profil bei Bedarf mit Lehrenden oder Lerncoaches besprechen</li>
-                <li>Nach einigen Wochen den Fragebogen wiederholen, um Entwicklungen zu erfassen</li>
-            </ol>
-        </div>
-    </div>
+    # Nächste Schritte, Hinweise, Dokumentende
+    parts.append(_HTML_FOOTER)
     
-    <div class="section">
-        <h2>Wichtige Hinweise</h2>
-        <p>Dieses Profil ist ein Prototyp zur strukturierten Selbstreflexion. 
-        Es ersetzt keine professionelle Beratung oder Diagnostik.</p>
-        <p><strong>Datenschutz:</strong> Dieses Profil wurde lokal auf Ihrem Computer erstellt. 
-        Sie entscheiden selbst, ob und mit wem Sie es teilen.</p>
-    </div>
-</body>
-</html>
-"""
-    
-    output_path.write_text(html, encoding="utf-8")
+    output_path.write_text("".join(parts), encoding="utf-8")
 
 
-def visualize_profile(profile_path: Path, output_dir: Path) -> None:
+def visualize_profile(profile_path: Path, output_dir: Path, embed_images: bool = True) -> Path:
     """
     Erstellt alle Visualisierungen für ein Profil.
+    Gibt den erzeugten Timestamp-Ordner zurück.
+    embed_images=False verlinkt die PNGs im Report relativ statt sie einzubetten.
     """
-    # Profil laden
-    with profile_path.open('r', encoding='utf-8') as f:
-        profile = json.load(f)
+    # Profil laden (Bytes in einem Stück, ohne vorgeschaltete Text-Decodierung)
+    raw = profile_path.read_bytes()
+    profile = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
     
     # Erzeuge charts/YYYY-MM-DD_HH-MM-SS/
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -494,25 +687,68 @@ def visualize_profile(profile_path: Path, output_dir: Path) -> None:
         
     print(f"Erstelle Visualisierungen für Profil: {profile['id']}")
     
-    # Visualisierungen erstellen
-    if MATPLOTLIB_AVAILABLE:
-        print("  → Radar-Chart...")
-        create_radar_chart(profile, output_dir / "radar_chart.png")
-        
-        print("  → Dimensionen-Balken...")
-        create_dimension_bars(profile, output_dir / "dimension_bars.png")
-        
-        print("  → Chronotyp-Visualisierung...")
-        create_chronotype_visualization(profile, output_dir / "chronotype.png")
+    # Visualisierungen erstellen (chart_paths: tatsächlich geschriebene Bilder, sonst None)
+    chart_paths: Dict[str, Optional[Path]] = dict.fromkeys(_CHART_FILES)
+    if _ensure_matplotlib():
+        try:
+            print("  → Radar-Chart...")
+            chart_paths["radar"] = create_radar_chart(profile, output_dir / _CHART_FILES["radar"])
+            
+            print("  → Dimensionen-Balken...")
+            chart_paths["bars"] = create_dimension_bars(profile, output_dir / _CHART_FILES["bars"])
+            
+            print("  → Chronotyp-Visualisierung...")
+            chart_paths["chronotype"] = create_chronotype_visualization(
+                profile, output_dir / _CHART_FILES["chronotype"])
+        finally:
+            _close_figure()
     else:
         print("  ⚠️  Matplotlib nicht verfügbar - überspringe Diagramme")
     
     # HTML-Report
     print("  → HTML-Report...")
-    generate_html_report(profile, output_dir / "report.html", output_dir)
+    generate_html_report(profile, output_dir / "report.html", output_dir,
+                         embed_images=embed_images, chart_paths=chart_paths)
     
     print(f"\n✓ Alle Visualisierungen gespeichert in: {output_dir}")
     print(f"  → Öffnen Sie {output_dir / 'report.html'} im Browser")
+    
+    return output_dir
+
+
+def _visualize_batch_item(job: Tuple[Path, Path, bool]) -> Optional[Path]:
+    """
+    Worker für den Batch-Modus (muss auf Modulebene liegen, damit er pickelbar ist).
+    Ein fehlerhaftes Profil bricht nicht den ganzen Batch ab: Fehler wird gemeldet, Ergebnis None.
+    """
+    profile_path, output_dir, embed_images = job
+    try:
+        return visualize_profile(profile_path, output_dir, embed_images)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"❌ Fehler bei {profile_path.name}: {e!r}", file=sys.stderr)
+        return None
+
+
+def visualize_profiles(profile_paths: List[Path], output_dir: Path,
+                       embed_images: bool = True) -> List[Optional[Path]]:
+    """
+    Erstellt Visualisierungen für mehrere Profile parallel.
+    
+    Jedes Profil erhält einen eigenen Unterordner output_dir/<dateiname>/, damit
+    gleichzeitig gestartete Läufe nicht im selben Timestamp-Ordner landen.
+    Jeder Worker importiert matplotlib nur einmal; die Figure wird pro Profil neu angelegt.
+    Für Profile, die nicht verarbeitet werden konnten, steht None in der Ergebnisliste.
+    """
+    jobs = [(path, output_dir / path.stem, embed_images) for path in profile_paths]
+    processes = min(os.cpu_count() or 1, len(jobs))
+    
+    if processes <= 1:
+        return [_visualize_batch_item(job) for job in jobs]
+    
+    # forkserver vermeidet fork() eines Prozesses mit geladenem matplotlib; Windows/macOS: spawn
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    with multiprocessing.get_context(start_method).Pool(processes) as pool:
+        return pool.map(_visualize_batch_item, jobs)
 
 
 # ---------------------------------------------------------------------------
@@ -526,7 +762,7 @@ def main():
     parser.add_argument(
         "profile_json",
         type=Path,
-        help="Pfad zur JSON-Profil-Datei",
+        help="Pfad zur JSON-Profil-Datei oder zu einem Verzeichnis mit Profilen (Batch)",
     )
     parser.add_argument(
         "--output",
@@ -535,6 +771,12 @@ def main():
         default=Path("charts"),
         help="Output-Verzeichnis für Visualisierungen (Standard: ./charts)",
     )
+    parser.add_argument(
+        "--no-embed",
+        action="store_true",
+        help="PNGs im HTML-Report nur relativ verlinken statt als data:-URI einbetten "
+             "(kleinerer Report, Bilder müssen daneben liegen)",
+    )
     
     args = parser.parse_args()
     
@@ -542,7 +784,19 @@ def main():
         print(f"❌ Profil-Datei nicht gefunden: {args.profile_json}", file=sys.stderr)
         sys.exit(1)
     
-    visualize_profile(args.profile_json, args.output)
+    if args.profile_json.is_dir():
+        profiles = sorted(args.profile_json.glob("*.json"))
+        if not profiles:
+            print(f"❌ Keine Profil-Dateien (*.json) in: {args.profile_json}", file=sys.stderr)
+            sys.exit(1)
+        results = visualize_profiles(profiles, args.output, embed_images=not args.no_embed)
+        failed = [path.name for path, result in zip(profiles, results) if result is None]
+        if failed:
+            print(f"❌ {len(failed)} von {len(profiles)} Profilen fehlgeschlagen: {', '.join(failed)}",
+                  file=sys.stderr)
+            sys.exit(1)
+    else:
+        visualize_profile(args.profile_json, args.output, embed_images=not args.no_embed)
 
 
 if __name__ == "__main__":